@@ -0,0 +1,22 @@
+"""
+Optional Numba JIT support
+
+Exposes an `njit` decorator that compiles with Numba when it is installed
+and falls back to the plain Python function otherwise, so the detection
+modules still work (just slower) without the dependency.
+"""
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is unavailable"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
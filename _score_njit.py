@@ -0,0 +1,284 @@
+"""
+Compiled confluence scoring kernel
+
+Pure-numeric core of the per-bar ICT confluence tally used by
+generate_signals_vectorized. The kernel walks every bar once, replays the
+same event selection and weighting rules as generate_signal on raw arrays,
+and returns the points, signal codes and confidences plus the selection
+state (which order block / FVG / displacement fired, window bounds for
+CHOCH and sweeps, penalty amounts) so the caller can rebuild the exact
+reasoning text without re-deriving any decision in Python.
+
+Compiled with Numba when available; the _njit fallback keeps it working
+(slower) without the dependency.
+"""
+import numpy as np
+
+from _njit import njit
+
+# HTF bias codes shared with the caller
+HTF_BULLISH = 1
+HTF_BEARISH = -1
+HTF_NEUTRAL = 0
+
+@njit(cache=True, nogil=True)
+def score_bars(close, kz_weights, in_kz, zone_premium, at_ote,
+               ob_start, ob_end, ob_high, ob_low, ob_bull,
+               fvg_start, fvg_high, fvg_low, fvg_bull,
+               sweep_idx, sweep_bull,
+               bos_idx, bos_bull,
+               disp_idx, disp_bull,
+               choch_idx, choch_bull,
+               has_htf, htf_code, lookback_days, start):
+    """
+    Score every bar from `start` on and return points plus selection state
+
+    Event arrays come from the batch detectors; sweep/BOS/displacement/
+    CHOCH index arrays must be sorted ascending (they are emitted
+    chronologically). Returns a tuple of per-bar arrays:
+
+    signal_code (+1 LONG / -1 SHORT / 0 NEUTRAL), confidence,
+    signal_points, choch windows [lo, hi), chosen OB / FVG indices with
+    tiers (-1 / 0 when none fired), sweep windows [lo, hi), BOS flag,
+    chosen displacement index, premium/discount penalty amounts, and the
+    HTF adjustment case (0 none, 1 long bonus, 2 long penalty,
+    3 short bonus, 4 short penalty) with its amount.
+    """
+    n = close.shape[0]
+
+    signal_code = np.zeros(n, dtype=np.int64)
+    confidence = np.zeros(n, dtype=np.int64)
+    signal_points = np.zeros(n, dtype=np.float64)
+    choch_lo = np.zeros(n, dtype=np.int64)
+    choch_hi = np.zeros(n, dtype=np.int64)
+    sel_bull_ob = np.full(n, -1, dtype=np.int64)
+    bull_ob_tier = np.zeros(n, dtype=np.int64)
+    sel_bear_ob = np.full(n, -1, dtype=np.int64)
+    bear_ob_tier = np.zeros(n, dtype=np.int64)
+    sel_bull_fvg = np.full(n, -1, dtype=np.int64)
+    bull_fvg_tier = np.zeros(n, dtype=np.int64)
+    sel_bear_fvg = np.full(n, -1, dtype=np.int64)
+    bear_fvg_tier = np.zeros(n, dtype=np.int64)
+    sweep_lo = np.zeros(n, dtype=np.int64)
+    sweep_hi = np.zeros(n, dtype=np.int64)
+    bos_flag = np.zeros(n, dtype=np.int64)
+    sel_disp = np.full(n, -1, dtype=np.int64)
+    prem_pen = np.zeros(n, dtype=np.float64)
+    disc_pen = np.zeros(n, dtype=np.float64)
+    htf_case = np.zeros(n, dtype=np.int64)
+    htf_amt = np.zeros(n, dtype=np.float64)
+
+    n_obs = ob_start.shape[0]
+    n_fvgs = fvg_start.shape[0]
+
+    for i in range(start, n):
+        price = close[i]
+        kz = in_kz[i]
+        prem = zone_premium[i]
+        ote = at_ote[i]
+        bull = 0.0
+        bear = 0.0
+
+        # CHOCH: confirmed one bar after the signal bar, last 2 in window
+        lo = np.searchsorted(choch_idx, i - 10)
+        hi = np.searchsorted(choch_idx, i - 2, side='right')
+        choch_lo[i] = lo
+        choch_hi[i] = hi
+        k0 = hi - 2 if hi - 2 > lo else lo
+        for k in range(k0, hi):
+            if choch_bull[k]:
+                bull += 10.0
+            else:
+                bear += 10.0
+
+        # Order blocks: first near-zone hit among the two most recent per
+        # side (recency keyed off the origin candle, displacement bar must
+        # have printed)
+        seen = 0
+        for k in range(n_obs):
+            if ob_bull[k] and ob_end[k] <= i and ob_start[k] >= i - lookback_days:
+                seen += 1
+                zh = ob_high[k]
+                zl = ob_low[k]
+                zr = zh - zl
+                buf = zr * 0.02 if zr > 0 else price * 0.02
+                if zl - buf <= price <= zh + buf:
+                    if ote and kz:
+                        bull += 12.0
+                        bull_ob_tier[i] = 3
+                    elif ote:
+                        bull += 9.0
+                        bull_ob_tier[i] = 2
+                    else:
+                        bull += 6.0
+                        bull_ob_tier[i] = 1
+                    sel_bull_ob[i] = k
+                    break
+                if seen >= 2:
+                    break
+
+        seen = 0
+        for k in range(n_obs):
+            if not ob_bull[k] and ob_end[k] <= i and ob_start[k] >= i - lookback_days:
+                seen += 1
+                zh = ob_high[k]
+                zl = ob_low[k]
+                zr = zh - zl
+                buf = zr * 0.02 if zr > 0 else price * 0.02
+                if zl - buf <= price <= zh + buf:
+                    if ote and kz:
+                        bear += 12.0
+                        bear_ob_tier[i] = 3
+                    elif ote:
+                        bear += 9.0
+                        bear_ob_tier[i] = 2
+                    else:
+                        bear += 6.0
+                        bear_ob_tier[i] = 1
+                    sel_bear_ob[i] = k
+                    break
+                if seen >= 2:
+                    break
+
+        # Fair value gaps: confirmed two bars after the gap opens
+        seen = 0
+        for k in range(n_fvgs):
+            if fvg_bull[k] and i - lookback_days <= fvg_start[k] <= i - 2:
+                seen += 1
+                if fvg_low[k] * 0.95 < price < fvg_high[k]:
+                    if not prem:
+                        bull += 9.0
+                        bull_fvg_tier[i] = 2
+                    else:
+                        bull += 4.0
+                        bull_fvg_tier[i] = 1
+                    sel_bull_fvg[i] = k
+                    break
+                if seen >= 2:
+                    break
+
+        seen = 0
+        for k in range(n_fvgs):
+            if not fvg_bull[k] and i - lookback_days <= fvg_start[k] <= i - 2:
+                seen += 1
+                if fvg_low[k] < price < fvg_high[k] * 1.05:
+                    if prem:
+                        bear += 9.0
+                        bear_fvg_tier[i] = 2
+                    else:
+                        bear += 4.0
+                        bear_fvg_tier[i] = 1
+                    sel_bear_fvg[i] = k
+                    break
+                if seen >= 2:
+                    break
+
+        # Liquidity sweeps: confirmed by the next bar, last 2 in window
+        lo = np.searchsorted(sweep_idx, i - 15)
+        hi = np.searchsorted(sweep_idx, i - 1, side='right')
+        sweep_lo[i] = lo
+        sweep_hi[i] = hi
+        k0 = hi - 2 if hi - 2 > lo else lo
+        for k in range(k0, hi):
+            if sweep_bull[k]:
+                bull += 6.0
+            else:
+                bear += 6.0
+
+        # Market structure: majority BOS direction over the window
+        lo = np.searchsorted(bos_idx, i - 30)
+        hi = np.searchsorted(bos_idx, i, side='right')
+        n_bull_bos = 0
+        for k in range(lo, hi):
+            if bos_bull[k]:
+                n_bull_bos += 1
+        n_bear_bos = (hi - lo) - n_bull_bos
+        if n_bull_bos > n_bear_bos:
+            bull += 4.0
+            bos_flag[i] = 1
+        elif n_bear_bos > n_bull_bos:
+            bear += 4.0
+            bos_flag[i] = -1
+
+        # Displacement: most recent only
+        lo = np.searchsorted(disp_idx, i - 10)
+        hi = np.searchsorted(disp_idx, i, side='right')
+        if hi > lo:
+            k = hi - 1
+            sel_disp[i] = k
+            if disp_bull[k]:
+                bull += 7.0
+            else:
+                bear += 7.0
+
+        # Penalties & adjustments, same order as generate_signal
+        w = kz_weights[i]
+        bull *= w
+        bear *= w
+
+        if prem and bull > 0:
+            prem_pen[i] = bull * 0.3
+            bull -= prem_pen[i]
+        if not prem and bear > 0:
+            disc_pen[i] = bear * 0.3
+            bear -= disc_pen[i]
+
+        if has_htf:
+            if bull > bear and bull >= 5.0:
+                direction = 1
+            elif bear > bull and bear >= 5.0:
+                direction = -1
+            else:
+                direction = 0
+
+            if direction == 1:
+                if htf_code == HTF_BULLISH:
+                    htf_amt[i] = bull * 0.1
+                    bull += htf_amt[i]
+                    htf_case[i] = 1
+                elif htf_code == HTF_BEARISH:
+                    htf_amt[i] = bull * 0.2
+                    bull -= htf_amt[i]
+                    htf_case[i] = 2
+            elif direction == -1:
+                if htf_code == HTF_BEARISH:
+                    htf_amt[i] = bear * 0.1
+                    bear += htf_amt[i]
+                    htf_case[i] = 3
+                elif htf_code == HTF_BULLISH:
+                    htf_amt[i] = bear * 0.2
+                    bear -= htf_amt[i]
+                    htf_case[i] = 4
+
+        # Final signal & confidence tiers
+        if bull > bear and bull >= 5.0:
+            signal_code[i] = 1
+            sp = bull
+        elif bear > bull and bear >= 5.0:
+            signal_code[i] = -1
+            sp = bear
+        else:
+            signal_code[i] = 0
+            sp = 0.0
+        signal_points[i] = sp
+
+        if sp >= 21:
+            conf = 80 + int(sp - 21)
+            if conf > 100:
+                conf = 100
+        elif sp >= 13:
+            conf = 60 + int((sp - 13) * 2.5)
+        elif sp >= 6:
+            conf = 30 + int((sp - 6) * 5)
+        else:
+            conf = int(sp * 6)
+            if conf > 30:
+                conf = 30
+        confidence[i] = conf
+
+    return (signal_code, confidence, signal_points,
+            choch_lo, choch_hi,
+            sel_bull_ob, bull_ob_tier, sel_bear_ob, bear_ob_tier,
+            sel_bull_fvg, bull_fvg_tier, sel_bear_fvg, bear_fvg_tier,
+            sweep_lo, sweep_hi, bos_flag, sel_disp,
+            prem_pen, disc_pen, htf_case, htf_amt)
@@ -5,20 +5,51 @@ Creates interactive candlestick charts with ICT zones
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
+import numpy as np
 
-def create_candlestick_chart(df, indicators, signal_info, ticker):
+def _downsample_ohlcv(df, max_points):
+    """
+    Bucket OHLCV down to roughly max_points bars for rendering
+
+    Groups consecutive bars positionally (works for any timeframe) and
+    aggregates with first/max/min/last/sum, labelling each bucket with
+    its first timestamp.
+    """
+    bucket = -(-len(df) // max_points)  # ceil division
+    if bucket <= 1:
+        return df
+
+    groups = np.arange(len(df)) // bucket
+    out = df.groupby(groups).agg({
+        'open': 'first',
+        'high': 'max',
+        'low': 'min',
+        'close': 'last',
+        'volume': 'sum'
+    })
+    out.index = df.index[::bucket]
+    return out
+
+def create_candlestick_chart(df, indicators, signal_info, ticker, max_points=2000):
     """
     Create interactive candlestick chart with ICT zones
-    
+
     Args:
         df: OHLCV dataframe
         indicators: Dict of ICT indicators from get_all_ict_indicators()
         signal_info: Dict from generate_signal()
         ticker: Stock ticker symbol
-    
+        max_points: Downsample to roughly this many candles before rendering
+
     Returns:
         Plotly figure
     """
+    # Indicator positions index into the original frame, so keep its index
+    # around for timestamp lookups, then cap what actually gets rendered
+    full_index = df.index
+    if len(df) > max_points:
+        df = _downsample_ohlcv(df, max_points)
+
     # Create figure with secondary y-axis for volume
     fig = make_subplots(
         rows=2, cols=1,
@@ -44,8 +75,8 @@ def create_candlestick_chart(df, indicators, signal_info, ticker):
     )
     
     # Add volume bars
-    colors = ['#26a69a' if close >= open else '#ef5350' 
-              for close, open in zip(df['close'], df['open'])]
+    colors = np.where(df['close'].to_numpy() >= df['open'].to_numpy(),
+                      '#26a69a', '#ef5350')
     
     fig.add_trace(
         go.Bar(
@@ -58,7 +89,8 @@ def create_candlestick_chart(df, indicators, signal_info, ticker):
         row=2, col=1
     )
     
-    # Color settings for zones
+    # Color settings for zones (border/label variants precomputed once
+    # instead of string-replacing per zone)
     zone_colors = {
         'bullish_ob': 'rgba(38, 166, 154, 0.2)',
         'bearish_ob': 'rgba(239, 83, 80, 0.2)',
@@ -66,72 +98,94 @@ def create_candlestick_chart(df, indicators, signal_info, ticker):
         'bearish_fvg': 'rgba(239, 154, 154, 0.3)',
         'bpr': 'rgba(158, 158, 158, 0.2)'
     }
-    
+    zone_border_colors = {
+        k: v.replace('0.2', '0.5').replace('0.3', '0.6')
+        for k, v in zone_colors.items()
+    }
+    zone_label_colors = {
+        k: v.replace('0.2', '0.8').replace('0.3', '0.8')
+        for k, v in zone_colors.items()
+    }
+
+    # Collect zone rectangles and labels into lists so the figure is
+    # validated once in update_layout instead of per add_shape call
+    shapes = []
+    zone_annotations = []
+
     # Add Order Blocks
     for ob in indicators.get('order_blocks', [])[-20:]:  # Show last 20
-        fig.add_shape(
+        shapes.append(dict(
             type="rect",
-            x0=df.index[ob['start_idx']],
-            x1=df.index[-1],
+            xref='x', yref='y',
+            x0=full_index[ob['start_idx']],
+            x1=full_index[-1],
             y0=ob['low'],
             y1=ob['high'],
             fillcolor=zone_colors.get(ob['type'], 'rgba(128, 128, 128, 0.2)'),
-            line=dict(color=zone_colors.get(ob['type']).replace('0.2', '0.5'), width=1),
-            layer='below',
-            row=1, col=1
-        )
-        
+            line=dict(color=zone_border_colors.get(ob['type']), width=1),
+            layer='below'
+        ))
+
         # Add label
-        fig.add_annotation(
-            x=df.index[ob['start_idx']],
+        zone_annotations.append(dict(
+            xref='x', yref='y',
+            x=full_index[ob['start_idx']],
             y=ob['high'],
             text="OB+" if ob['type'] == 'bullish_ob' else "OB-",
             showarrow=False,
             font=dict(size=10, color='white'),
-            bgcolor=zone_colors.get(ob['type']).replace('0.2', '0.8'),
-            row=1, col=1
-        )
-    
+            bgcolor=zone_label_colors.get(ob['type'])
+        ))
+
     # Add Fair Value Gaps
     for fvg in indicators.get('fair_value_gaps', [])[-15:]:  # Show last 15
-        fig.add_shape(
+        shapes.append(dict(
             type="rect",
-            x0=df.index[fvg['start_idx']],
-            x1=df.index[-1],
+            xref='x', yref='y',
+            x0=full_index[fvg['start_idx']],
+            x1=full_index[-1],
             y0=fvg['gap_low'],
             y1=fvg['gap_high'],
             fillcolor=zone_colors.get(fvg['type'], 'rgba(128, 128, 128, 0.3)'),
-            line=dict(color=zone_colors.get(fvg['type']).replace('0.3', '0.6'), width=1, dash='dot'),
-            layer='below',
-            row=1, col=1
-        )
-        
+            line=dict(color=zone_border_colors.get(fvg['type']), width=1, dash='dot'),
+            layer='below'
+        ))
+
         # Add label
-        fig.add_annotation(
-            x=df.index[fvg['start_idx']],
+        zone_annotations.append(dict(
+            xref='x', yref='y',
+            x=full_index[fvg['start_idx']],
             y=fvg['gap_high'],
             text="FVG+",
             showarrow=False,
             font=dict(size=9, color='white'),
-            bgcolor=zone_colors.get(fvg['type']).replace('0.3', '0.8'),
-            row=1, col=1
-        )
+            bgcolor=zone_label_colors.get(fvg['type'])
+        ))
+
+    # Single batched layout update (keep the subplot title annotations)
+    fig.update_layout(
+        shapes=shapes,
+        annotations=tuple(fig.layout.annotations) + tuple(zone_annotations)
+    )
     
-    # Add Liquidity Sweeps
-    for sweep in indicators.get('liquidity_sweeps', [])[-10:]:
-        marker_color = '#26a69a' if sweep['reversal'] == 'bullish' else '#ef5350'
+    # Add Liquidity Sweeps - one marker trace for all sweeps instead of a
+    # trace per sweep
+    sweeps = indicators.get('liquidity_sweeps', [])[-10:]
+    if sweeps:
         fig.add_trace(
             go.Scatter(
-                x=[df.index[sweep['idx']]],
-                y=[sweep['price']],
+                x=[full_index[s['idx']] for s in sweeps],
+                y=[s['price'] for s in sweeps],
                 mode='markers',
                 marker=dict(
-                    symbol='triangle-up' if sweep['reversal'] == 'bullish' else 'triangle-down',
+                    symbol=['triangle-up' if s['reversal'] == 'bullish'
+                            else 'triangle-down' for s in sweeps],
                     size=15,
-                    color=marker_color,
+                    color=['#26a69a' if s['reversal'] == 'bullish'
+                           else '#ef5350' for s in sweeps],
                     line=dict(color='white', width=2)
                 ),
-                name=f"Sweep ({sweep['reversal']})",
+                name='Liquidity Sweeps',
                 showlegend=False
             ),
             row=1, col=1
@@ -160,7 +214,7 @@ def create_candlestick_chart(df, indicators, signal_info, ticker):
     }.get(signal, '#9e9e9e')
     
     fig.add_annotation(
-        x=df.index[-1],
+        x=full_index[-1],
         y=current_price,
         text=f"{signal}<br>({confidence}%)",
         showarrow=True,
@@ -237,6 +291,19 @@ def create_candlestick_chart(df, indicators, signal_info, ticker):
     
     return fig
 
+def _to_columnar(backtest_results):
+    """
+    Convert a list of backtest result dicts to a dict of NumPy arrays
+
+    Column-wise conversion skips pandas' per-row DataFrame constructor,
+    which is the slow path for list-of-dicts input. Callers that already
+    hold column arrays can pass the dict straight through.
+    """
+    if isinstance(backtest_results, dict):
+        return backtest_results
+    keys = ('date', 'signal', 'confidence', 'price_change_pct', 'correct')
+    return {k: np.asarray([r[k] for r in backtest_results]) for k in keys}
+
 def create_backtest_chart(df, backtest_results):
     """
     Create chart showing backtest results over time
@@ -250,9 +317,9 @@ def create_backtest_chart(df, backtest_results):
     """
     if not backtest_results:
         return None
-    
-    results_df = pd.DataFrame(backtest_results)
-    
+
+    cols = _to_columnar(backtest_results)
+
     # Create subplot
     fig = make_subplots(
         rows=2, cols=1,
@@ -262,37 +329,41 @@ def create_backtest_chart(df, backtest_results):
         row_heights=[0.6, 0.4]
     )
     
-    # Add scatter plot of results
-    colors = ['green' if r else 'red' for r in results_df['correct']]
-    
+    # Add scatter plot of results (WebGL - markers rasterize on the GPU
+    # instead of one SVG node per point)
+    pct = cols['price_change_pct']
+    colors = np.where(cols['correct'], 'green', 'red')
+    hover_text = ('Signal: ' + cols['signal'].astype(object) +
+                  '<br>Confidence: ' + cols['confidence'].astype(str).astype(object) +
+                  '%<br>Return: ' + np.round(pct, 2).astype(str).astype(object) + '%')
+
     fig.add_trace(
-        go.Scatter(
-            x=results_df['date'],
-            y=results_df['price_change_pct'],
+        go.Scattergl(
+            x=cols['date'],
+            y=pct,
             mode='markers',
             marker=dict(
-                size=results_df['confidence'] / 5,  # Size based on confidence
+                size=cols['confidence'] / 5,  # Size based on confidence
                 color=colors,
                 line=dict(color='white', width=1)
             ),
-            text=[f"Signal: {s}<br>Confidence: {c}%<br>Return: {p:.2f}%" 
-                  for s, c, p in zip(results_df['signal'], results_df['confidence'], results_df['price_change_pct'])],
+            text=hover_text,
             hoverinfo='text',
             name='Signals'
         ),
         row=1, col=1
     )
-    
+
     # Add zero line
     fig.add_hline(y=0, line=dict(color='gray', width=1, dash='dash'), row=1, col=1)
-    
+
     # Calculate and plot cumulative returns
-    results_df['cumulative_return'] = (1 + results_df['price_change_pct'] / 100).cumprod() - 1
-    
+    cumulative_return = np.cumprod(1 + pct / 100) - 1
+
     fig.add_trace(
         go.Scatter(
-            x=results_df['date'],
-            y=results_df['cumulative_return'] * 100,
+            x=cols['date'],
+            y=cumulative_return * 100,
             mode='lines',
             line=dict(color='#2196F3', width=2),
             fill='tozeroy',
@@ -1,12 +1,33 @@
 """
 Data fetching module using yfinance API
 """
+import os
+from pathlib import Path
+
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# On-disk parquet cache: survives Streamlit restarts and is shared across
+# sessions (st.cache_data is per-process memory only). Keyed by UTC date
+# so entries refresh daily.
+CACHE_DIR = Path(os.environ.get("ICT_CACHE_DIR", ".cache"))
+
+def _disk_cache_path(ticker, period, interval):
+    """Parquet cache path for a (ticker, period, interval) + today bucket"""
+    today = datetime.utcnow().strftime("%Y%m%d")
+    return CACHE_DIR / f"{ticker}_{period}_{interval}_{today}.parquet"
+
+# Optional Polars backend for large-frame resampling (Plotly 6 renders
+# Polars frames natively via Narwhals, no pandas round-trip needed)
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
 def fetch_stock_data(ticker, period="1y", interval="1d"):
     """
     Fetch historical stock data using yfinance
@@ -20,22 +41,32 @@ def fetch_stock_data(ticker, period="1y", interval="1d"):
         DataFrame with OHLCV data
     """
     try:
+        cache_path = _disk_cache_path(ticker, period, interval)
+        if cache_path.exists():
+            return pd.read_parquet(cache_path)
+
         stock = yf.Ticker(ticker)
         df = stock.history(period=period, interval=interval)
-        
+
         if df.empty:
             st.error(f"No data found for {ticker}")
             return None
-        
+
         # Clean column names
         df.columns = [col.lower() for col in df.columns]
-        
+
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_path, compression='zstd')
+        except Exception:
+            pass  # cache write failure is non-fatal; serve the live data
+
         return df
     except Exception as e:
         st.error(f"Error fetching data for {ticker}: {str(e)}")
         return None
 
-@st.cache_data(ttl=3600)
+@st.cache_data(ttl=3600, show_spinner=False)
 def fetch_stock_data_range(ticker, start_date, end_date, interval="1d"):
     """
     Fetch historical stock data for a specific date range
@@ -65,6 +96,46 @@ def fetch_stock_data_range(ticker, start_date, end_date, interval="1d"):
         st.error(f"Error fetching data for {ticker}: {str(e)}")
         return None
 
+# Single aggregation spec shared by every OHLCV resample
+OHLCV_AGG = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum'
+}
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def resample_ohlcv(df, rule, backend="pandas"):
+    """
+    Resample an OHLCV frame to a coarser timeframe in one aggregation pass
+
+    Args:
+        df: OHLCV DataFrame
+        rule: pandas offset alias (e.g. '4h', 'W')
+        backend: 'pandas' (default) or 'polars' - the opt-in Polars path
+                 runs the aggregation through group_by_dynamic and returns
+                 a Polars frame Plotly can render directly
+
+    Returns:
+        Resampled DataFrame with empty buckets dropped
+    """
+    if backend == "polars" and POLARS_AVAILABLE:
+        pldf = pl.from_pandas(df.reset_index(names='datetime'))
+        return (
+            pldf.sort('datetime')
+            .group_by_dynamic('datetime', every=rule.lower())
+            .agg([
+                pl.col('open').first(),
+                pl.col('high').max(),
+                pl.col('low').min(),
+                pl.col('close').last(),
+                pl.col('volume').sum(),
+            ])
+            .drop_nulls()
+        )
+    return df.resample(rule, label='right', closed='right').agg(OHLCV_AGG).dropna()
+
 def get_multiple_timeframes(ticker, periods=None):
     """
     Fetch data for multiple timeframes for better ICT analysis
@@ -87,17 +158,11 @@ def get_multiple_timeframes(ticker, periods=None):
     for name, (period, interval) in periods.items():
         df = fetch_stock_data(ticker, period, interval)
         if df is not None:
-            # Resample 1h to 4h if needed
+            # Resample 1h to 4h if needed (cached, single aggregation pass)
             if name == "4h" and interval == "1h":
-                df = df.resample('4H').agg({
-                    'open': 'first',
-                    'high': 'max',
-                    'low': 'min',
-                    'close': 'last',
-                    'volume': 'sum'
-                }).dropna()
+                df = resample_ohlcv(df, '4h')
             data[name] = df
-    
+
     return data
 
 # Major indices and MAG7 stocks
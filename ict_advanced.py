@@ -8,9 +8,16 @@ Advanced ICT Strategy Functions
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from functools import lru_cache
 import pytz
 
+from _njit import njit
+
 # Kill Zone definitions (EST timezone)
+# Timezone handles created once (avoids the tz-database lookup per call)
+_EST = pytz.timezone('US/Eastern')
+_UTC = pytz.UTC
+
 KILL_ZONES = {
     'LONDON_KILLZONE': (2, 5),      # 2:00 AM - 5:00 AM EST
     'NEW_YORK_AM': (7, 10),         # 7:00 AM - 10:00 AM EST (⭐ BEST)
@@ -26,6 +33,85 @@ KILL_ZONE_WEIGHTS = {
     'OUTSIDE': 0.6,          # Significant penalty
 }
 
+POWER_OF_3_PHASES = {
+    'ACCUMULATION': {
+        'description': 'Consolidation & Setup Formation',
+        'trade_recommendation': 'WAIT - Mark key levels'
+    },
+    'MANIPULATION': {
+        'description': 'Liquidity Sweeps & False Moves',
+        'trade_recommendation': 'CAUTIOUS - Watch for reversals'
+    },
+    'DISTRIBUTION': {
+        'description': 'True Institutional Direction',
+        'trade_recommendation': 'ACTIVE - Best time to trade'
+    },
+    'AFTER_HOURS': {
+        'description': 'Low Activity Period',
+        'trade_recommendation': 'AVOID - Low liquidity'
+    },
+}
+
+# Hour-indexed lookup tables (EST hour -> zone name / weight / phase),
+# built once at import so per-timestamp checks are a single array index
+_KZ_NAMES = np.array(['OUTSIDE'] * 24, dtype=object)
+for _zone, (_start, _end) in KILL_ZONES.items():
+    _KZ_NAMES[_start:_end] = _zone
+_KZ_WEIGHTS = np.array([KILL_ZONE_WEIGHTS[z] for z in _KZ_NAMES])
+
+_POW3_NAMES = np.array(
+    ['ACCUMULATION'] * 8 + ['MANIPULATION'] * 3 +
+    ['DISTRIBUTION'] * 5 + ['AFTER_HOURS'] * 8, dtype=object)
+
+@lru_cache(maxsize=24)
+def _killzone_by_hour(hour):
+    """Memoized (in_zone, zone_name, weight) tuple for an EST hour"""
+    zone_name = _KZ_NAMES[hour]
+    return (zone_name != 'OUTSIDE', zone_name, KILL_ZONE_WEIGHTS[zone_name])
+
+@lru_cache(maxsize=24)
+def _phase_by_hour(hour):
+    """Memoized (phase, description, recommendation) tuple for an EST hour"""
+    phase = _POW3_NAMES[hour]
+    info = POWER_OF_3_PHASES[phase]
+    return (phase, info['description'], info['trade_recommendation'])
+
+def _to_est_hour(timestamp):
+    """Convert a timestamp (naive treated as UTC) to its EST hour"""
+    if timestamp.tz is None:
+        # Assume UTC if no timezone
+        timestamp = _UTC.localize(timestamp)
+    return timestamp.astimezone(_EST).hour
+
+def kill_zones_for_index(df_index):
+    """
+    Vectorized kill-zone lookup for a whole DatetimeIndex
+
+    Args:
+        df_index: pandas DatetimeIndex (naive treated as UTC)
+
+    Returns:
+        Tuple (names, weights) arrays aligned with df_index
+    """
+    if df_index.tz is None:
+        df_index = df_index.tz_localize(_UTC)
+    hours = df_index.tz_convert(_EST).hour
+    return _KZ_NAMES[hours], _KZ_WEIGHTS[hours]
+
+def power_of_3_for_index(df_index):
+    """
+    Vectorized Power of 3 phase lookup for a whole DatetimeIndex
+
+    Args:
+        df_index: pandas DatetimeIndex (naive treated as UTC)
+
+    Returns:
+        Array of phase names aligned with df_index
+    """
+    if df_index.tz is None:
+        df_index = df_index.tz_localize(_UTC)
+    return _POW3_NAMES[df_index.tz_convert(_EST).hour]
+
 def is_in_kill_zone(timestamp, return_zone=False):
     """
     Check if timestamp is within a kill zone
@@ -38,106 +124,139 @@ def is_in_kill_zone(timestamp, return_zone=False):
         If return_zone=False: Boolean
         If return_zone=True: Tuple (is_in_zone, zone_name, weight)
     """
-    # Convert to EST timezone
-    est = pytz.timezone('US/Eastern')
-    if timestamp.tz is None:
-        # Assume UTC if no timezone
-        timestamp = pytz.UTC.localize(timestamp)
-    
-    est_time = timestamp.astimezone(est)
-    hour = est_time.hour
-    
-    # Check which kill zone we're in
-    for zone_name, (start_hour, end_hour) in KILL_ZONES.items():
-        if start_hour <= hour < end_hour:
-            weight = KILL_ZONE_WEIGHTS[zone_name]
-            if return_zone:
-                return (True, zone_name, weight)
-            return True
-    
-    # Outside all kill zones
+    in_zone, zone_name, weight = _killzone_by_hour(_to_est_hour(timestamp))
     if return_zone:
-        return (False, 'OUTSIDE', KILL_ZONE_WEIGHTS['OUTSIDE'])
-    return False
+        return (in_zone, zone_name, weight)
+    return in_zone
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _detect_choch_kernel(close, volume,
+                         swing_high_idx, swing_high_price,
+                         swing_low_idx, swing_low_price, lookback):
+    """
+    Compiled CHOCH scan operating on raw NumPy arrays
+
+    Swing points are detected vectorized by the caller and passed in as
+    parallel index/price arrays.
+
+    Returns parallel arrays (idx, price, broken_level, strength, direction)
+    where direction is +1 for bullish and -1 for bearish.
+    """
+    n = len(close)
+    n_sh = len(swing_high_idx)
+    n_sl = len(swing_low_idx)
+
+    # Look for CHOCH patterns in recent candles (at most one bullish and
+    # one bearish signal per bar)
+    out_idx = np.empty(2 * n, dtype=np.int64)
+    out_price = np.empty(2 * n, dtype=np.float64)
+    out_level = np.empty(2 * n, dtype=np.float64)
+    out_strength = np.empty(2 * n, dtype=np.float64)
+    out_direction = np.empty(2 * n, dtype=np.int64)
+    count = 0
+
+    for i in range(lookback, n):
+        if i < 5:
+            continue
+
+        curr_close = close[i]
+
+        # Check volume and momentum
+        volume_sum = 0.0
+        for j in range(i-5, i):
+            volume_sum += volume[j]
+        volume_decreasing = volume[i] < (volume_sum / 5.0) * 0.8
+
+        # Price change momentum
+        price_momentum = abs(close[i] - close[i-3]) / close[i-3]
+
+        # Check if momentum is weak (key difference from BOS), and look
+        # ahead one bar to see if price reversed
+        weak = volume_decreasing or price_momentum < 0.01
+
+        # Only the nearest swing older than i-5 can matter, so binary
+        # search for it instead of scanning every swing per bar
+        # (swing index arrays are sorted ascending)
+
+        # Bullish CHOCH: Broke swing low but failed to continue down
+        pos = np.searchsorted(swing_low_idx, i - 5)
+        if pos > 0:
+            k = pos - 1
+            if swing_low_idx[k] > i - lookback and curr_close < swing_low_price[k]:
+                if weak and i < n - 2 and close[i+1] > curr_close:
+                    out_idx[count] = i
+                    out_price[count] = curr_close
+                    out_level[count] = swing_low_price[k]
+                    out_strength[count] = 1.0 - price_momentum
+                    out_direction[count] = 1
+                    count += 1
+
+        # Bearish CHOCH: Broke swing high but failed to continue up
+        pos = np.searchsorted(swing_high_idx, i - 5)
+        if pos > 0:
+            k = pos - 1
+            if swing_high_idx[k] > i - lookback and curr_close > swing_high_price[k]:
+                if weak and i < n - 2 and close[i+1] < curr_close:
+                    out_idx[count] = i
+                    out_price[count] = curr_close
+                    out_level[count] = swing_high_price[k]
+                    out_strength[count] = 1.0 - price_momentum
+                    out_direction[count] = -1
+                    count += 1
+
+    return (out_idx[:count], out_price[:count], out_level[:count],
+            out_strength[:count], out_direction[:count])
 
 def detect_choch(df, swing_length=5, lookback=50):
     """
     Detect Change of Character (CHOCH) - signals trend exhaustion
-    
+
     CHOCH differs from BOS:
     - BOS = Strong break with continuation
     - CHOCH = Break with weakening momentum (reversal signal)
-    
+
+    The numeric scan is JIT-compiled with Numba (when available); this
+    wrapper just extracts the arrays and packages results into dicts.
+
     Returns:
         List of dicts with {type, idx, price, direction, strength}
     """
+    # Extract each column to a NumPy array exactly once; everything below
+    # indexes C arrays rather than going through pandas iloc
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy(dtype=np.float64)
+
+    # Vectorized swing detection: a bar is a swing high/low when it equals
+    # the centered rolling window extreme (NaN at the edges keeps
+    # unconfirmed swings out of the masks)
+    window = 2 * swing_length + 1
+    roll_hi = df['high'].rolling(window, center=True).max().to_numpy()
+    roll_lo = df['low'].rolling(window, center=True).min().to_numpy()
+    swing_high_idx = np.flatnonzero(high == roll_hi)
+    swing_low_idx = np.flatnonzero(low == roll_lo)
+
+    idx, price, level, strength, direction = _detect_choch_kernel(
+        close, volume,
+        swing_high_idx, high[swing_high_idx],
+        swing_low_idx, low[swing_low_idx],
+        lookback
+    )
+
     choch_signals = []
-    swing_highs = []
-    swing_lows = []
-    
-    # Find swing highs and lows
-    for i in range(swing_length, min(len(df) - swing_length, lookback)):
-        # Swing high
-        if df['high'].iloc[i] == df['high'].iloc[i-swing_length:i+swing_length+1].max():
-            swing_highs.append({'idx': i, 'price': df['high'].iloc[i]})
-        
-        # Swing low
-        if df['low'].iloc[i] == df['low'].iloc[i-swing_length:i+swing_length+1].min():
-            swing_lows.append({'idx': i, 'price': df['low'].iloc[i]})
-    
-    # Look for CHOCH patterns in recent candles
-    for i in range(lookback, len(df)):
-        curr_close = df['close'].iloc[i]
-        
-        # Check volume and momentum
-        if i >= 5:
-            recent_volume = df['volume'].iloc[i-5:i].mean()
-            curr_volume = df['volume'].iloc[i]
-            volume_decreasing = curr_volume < recent_volume * 0.8
-            
-            # Price change momentum
-            price_momentum = abs(df['close'].iloc[i] - df['close'].iloc[i-3]) / df['close'].iloc[i-3]
-            
-            # Bullish CHOCH: Broke swing low but failed to continue down
-            for sl in swing_lows:
-                if sl['idx'] < i - 5 and sl['idx'] > i - lookback:
-                    if curr_close < sl['price']:  # Broke below swing low
-                        # Check if momentum is weak (this is key difference from BOS)
-                        if volume_decreasing or price_momentum < 0.01:
-                            # Look ahead to see if it reversed
-                            if i < len(df) - 2:
-                                next_close = df['close'].iloc[i+1]
-                                if next_close > curr_close:  # Price reversed up
-                                    choch_signals.append({
-                                        'type': 'choch',
-                                        'direction': 'bullish',  # Expecting reversal up
-                                        'idx': i,
-                                        'price': curr_close,
-                                        'broken_level': sl['price'],
-                                        'strength': 1.0 - price_momentum,  # Weaker = stronger CHOCH
-                                        'timestamp': df.index[i]
-                                    })
-                                    break
-            
-            # Bearish CHOCH: Broke swing high but failed to continue up
-            for sh in swing_highs:
-                if sh['idx'] < i - 5 and sh['idx'] > i - lookback:
-                    if curr_close > sh['price']:  # Broke above swing high
-                        if volume_decreasing or price_momentum < 0.01:
-                            if i < len(df) - 2:
-                                next_close = df['close'].iloc[i+1]
-                                if next_close < curr_close:  # Price reversed down
-                                    choch_signals.append({
-                                        'type': 'choch',
-                                        'direction': 'bearish',  # Expecting reversal down
-                                        'idx': i,
-                                        'price': curr_close,
-                                        'broken_level': sh['price'],
-                                        'strength': 1.0 - price_momentum,
-                                        'timestamp': df.index[i]
-                                    })
-                                    break
-    
+    for k in range(len(idx)):
+        i = int(idx[k])
+        choch_signals.append({
+            'type': 'choch',
+            'direction': 'bullish' if direction[k] > 0 else 'bearish',
+            'idx': i,
+            'price': price[k],
+            'broken_level': level[k],
+            'strength': strength[k],  # Weaker momentum = stronger CHOCH
+            'timestamp': df.index[i]
+        })
+
     return choch_signals
 
 def calculate_premium_discount_zone(df, lookback=24):
@@ -150,9 +269,10 @@ def calculate_premium_discount_zone(df, lookback=24):
     Returns:
         Dict with {zone, range_high, range_low, midpoint, price_position}
     """
-    # Use recent high/low for the range
-    recent_high = df['high'].iloc[-lookback:].max()
-    recent_low = df['low'].iloc[-lookback:].min()
+    # Use recent high/low for the range (NumPy tail reductions skip the
+    # pandas Series allocation per call)
+    recent_high = df['high'].to_numpy()[-lookback:].max()
+    recent_low = df['low'].to_numpy()[-lookback:].min()
     midpoint = (recent_high + recent_low) / 2
     current_price = df['close'].iloc[-1]
     
@@ -185,6 +305,42 @@ def calculate_premium_discount_zone(df, lookback=24):
         'current_price': current_price
     }
 
+def calculate_premium_discount_zone_series(df, lookback=24):
+    """
+    Vectorized premium/discount classification for every bar at once
+
+    Computes the rolling range in one pass so backtest-style callers can
+    index per-bar results in O(1) instead of calling
+    calculate_premium_discount_zone per bar.
+
+    Returns:
+        Dict of arrays {zone, detailed_zone, range_high, range_low,
+        price_position} aligned with df.index
+    """
+    range_high = df['high'].rolling(lookback).max().to_numpy()
+    range_low = df['low'].rolling(lookback).min().to_numpy()
+    close = df['close'].to_numpy()
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        price_position = np.where(range_high != range_low,
+                                  (close - range_low) / (range_high - range_low),
+                                  0.5)
+
+    zone = np.where(price_position > 0.5, 'PREMIUM', 'DISCOUNT')
+    detailed_zone = np.select(
+        [price_position > 0.7, price_position > 0.5, price_position < 0.3],
+        ['EXTREME_PREMIUM', 'PREMIUM', 'EXTREME_DISCOUNT'],
+        default='DISCOUNT'
+    )
+
+    return {
+        'zone': zone,
+        'detailed_zone': detailed_zone,
+        'range_high': range_high,
+        'range_low': range_low,
+        'price_position': price_position
+    }
+
 def get_power_of_3_phase(timestamp):
     """
     Determine which Power of 3 phase we're in
@@ -198,41 +354,14 @@ def get_power_of_3_phase(timestamp):
     Returns:
         Dict with {phase, hour, description}
     """
-    est = pytz.timezone('US/Eastern')
-    if timestamp.tz is None:
-        timestamp = pytz.UTC.localize(timestamp)
-    
-    est_time = timestamp.astimezone(est)
-    hour = est_time.hour
-    
-    if 0 <= hour < 8:
-        return {
-            'phase': 'ACCUMULATION',
-            'hour': hour,
-            'description': 'Consolidation & Setup Formation',
-            'trade_recommendation': 'WAIT - Mark key levels'
-        }
-    elif 8 <= hour < 11:
-        return {
-            'phase': 'MANIPULATION',
-            'hour': hour,
-            'description': 'Liquidity Sweeps & False Moves',
-            'trade_recommendation': 'CAUTIOUS - Watch for reversals'
-        }
-    elif 11 <= hour < 16:
-        return {
-            'phase': 'DISTRIBUTION',
-            'hour': hour,
-            'description': 'True Institutional Direction',
-            'trade_recommendation': 'ACTIVE - Best time to trade'
-        }
-    else:
-        return {
-            'phase': 'AFTER_HOURS',
-            'hour': hour,
-            'description': 'Low Activity Period',
-            'trade_recommendation': 'AVOID - Low liquidity'
-        }
+    hour = _to_est_hour(timestamp)
+    phase, description, recommendation = _phase_by_hour(hour)
+    return {
+        'phase': phase,
+        'hour': hour,
+        'description': description,
+        'trade_recommendation': recommendation
+    }
 
 def detect_session_liquidity(df):
     """
@@ -246,44 +375,32 @@ def detect_session_liquidity(df):
     Returns:
         Dict with session highs/lows
     """
-    est = pytz.timezone('US/Eastern')
-    
     session_levels = {
         'asian': {'high': None, 'low': None, 'swept': False},
         'london': {'high': None, 'low': None, 'swept': False},
         'newyork': {'high': None, 'low': None, 'swept': False}
     }
-    
-    for i, timestamp in enumerate(df.index):
-        if timestamp.tz is None:
-            timestamp = pytz.UTC.localize(timestamp)
-        est_time = timestamp.astimezone(est)
-        hour = est_time.hour
-        
-        price_high = df['high'].iloc[i]
-        price_low = df['low'].iloc[i]
-        
-        # Asian session (19:00 - 23:59 EST)
-        if 19 <= hour <= 23:
-            if session_levels['asian']['high'] is None or price_high > session_levels['asian']['high']:
-                session_levels['asian']['high'] = price_high
-            if session_levels['asian']['low'] is None or price_low < session_levels['asian']['low']:
-                session_levels['asian']['low'] = price_low
-        
-        # London session (2:00 - 10:00 EST)
-        elif 2 <= hour < 10:
-            if session_levels['london']['high'] is None or price_high > session_levels['london']['high']:
-                session_levels['london']['high'] = price_high
-            if session_levels['london']['low'] is None or price_low < session_levels['london']['low']:
-                session_levels['london']['low'] = price_low
-        
-        # New York session (7:00 - 16:00 EST)
-        elif 7 <= hour < 16:
-            if session_levels['newyork']['high'] is None or price_high > session_levels['newyork']['high']:
-                session_levels['newyork']['high'] = price_high
-            if session_levels['newyork']['low'] is None or price_low < session_levels['newyork']['low']:
-                session_levels['newyork']['low'] = price_low
-    
+
+    # One tz conversion for the whole index instead of per-bar localize
+    idx = df.index if df.index.tz is not None else df.index.tz_localize(_UTC)
+    hours = idx.tz_convert(_EST).hour.to_numpy()
+
+    # Asian (19:00 - 23:59), London (2:00 - 10:00), New York (7:00 - 16:00);
+    # first match wins for overlapping hours, as before
+    session = np.select(
+        [(hours >= 19) & (hours <= 23),
+         (hours >= 2) & (hours < 10),
+         (hours >= 7) & (hours < 16)],
+        ['asian', 'london', 'newyork'],
+        default='none'
+    )
+
+    for name in session_levels:
+        mask = session == name
+        if mask.any():
+            session_levels[name]['high'] = df['high'].to_numpy()[mask].max()
+            session_levels[name]['low'] = df['low'].to_numpy()[mask].min()
+
     return session_levels
 
 def get_htf_bias(df, current_timeframe='1h'):
@@ -316,26 +433,14 @@ def get_htf_bias(df, current_timeframe='1h'):
     recent_lows = recent_df['low']
     recent_closes = recent_df['close']
     
-    # Check for higher highs and higher lows (bullish)
-    hh_count = 0
-    hl_count = 0
-    lh_count = 0
-    ll_count = 0
-    
-    for i in range(5, len(recent_df)):
-        current_high = recent_df['high'].iloc[i]
-        previous_high = recent_df['high'].iloc[i-5:i].max()
-        current_low = recent_df['low'].iloc[i]
-        previous_low = recent_df['low'].iloc[i-5:i].min()
-        
-        if current_high > previous_high:
-            hh_count += 1
-        if current_low > previous_low:
-            hl_count +=1
-        if current_high < previous_high:
-            lh_count += 1
-        if current_low < previous_low:
-            ll_count += 1
+    # Check for higher highs/lows (bullish) vs lower highs/lows (bearish)
+    # against the rolling 5-bar extreme, all in vectorized comparisons
+    prev_hi = recent_highs.shift(1).rolling(5).max()
+    prev_lo = recent_lows.shift(1).rolling(5).min()
+    hh_count = int((recent_highs > prev_hi).sum())
+    hl_count = int((recent_lows > prev_lo).sum())
+    lh_count = int((recent_highs < prev_hi).sum())
+    ll_count = int((recent_lows < prev_lo).sum())
     
     # Determine bias
     bullish_structure = (hh_count + hl_count)
@@ -14,135 +14,443 @@ Implements all major ICT concepts:
 """
 import pandas as pd
 import numpy as np
+from scipy.signal import argrelextrema
+
+from _njit import njit, prange, NUMBA_AVAILABLE
+
+# Optional C-level rolling primitives; the pandas rolling path is the
+# fallback when bottleneck is not installed
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+def _shift1(arr):
+    """Shift a rolling-stat array forward one bar so position i covers
+    the trailing window [i-w, i) excluding the current bar"""
+    out = np.empty_like(arr)
+    out[0] = np.nan
+    out[1:] = arr[:-1]
+    return out
+
+def _pct_change(close):
+    """Bar-over-bar percent change with a NaN head, in one diff"""
+    out = np.empty(len(close))
+    out[0] = np.nan
+    out[1:] = np.diff(close) / close[:-1]
+    return out
 
 def detect_order_blocks(df, lookback=20, displacement_threshold=0.015):
     """
     Detect Order Blocks - last opposite candle before strong displacement
-    
+
     Returns:
         List of dicts with {type, start_idx, end_idx, high, low, strength}
     """
+    return _detect_order_blocks_arr(df['open'].to_numpy(),
+                                    df['high'].to_numpy(),
+                                    df['low'].to_numpy(),
+                                    df['close'].to_numpy(),
+                                    df.index, lookback,
+                                    displacement_threshold)
+
+def _detect_order_blocks_arr(open_, high, low, close, index,
+                             lookback, displacement_threshold,
+                             pct_change=None):
+    """Order-block detection over preconverted column arrays"""
     order_blocks = []
-    
-    for i in range(lookback, len(df)):
-        # Calculate displacement (strong move)
-        curr_close = df['close'].iloc[i]
-        prev_close = df['close'].iloc[i-1]
-        displacement = abs(curr_close - prev_close) / prev_close
-        
-        if displacement > displacement_threshold:
-            # Bullish displacement - look for last bearish candle
-            if curr_close > prev_close:
-                for j in range(i-1, max(i-lookback, 0), -1):
-                    if df['close'].iloc[j] < df['open'].iloc[j]:  # Bearish candle
-                        order_blocks.append({
-                            'type': 'bullish_ob',
-                            'start_idx': j,
-                            'end_idx': i,
-                            'high': df['high'].iloc[j],
-                            'low': df['low'].iloc[j],
-                            'strength': displacement,
-                            'timestamp': df.index[j]
-                        })
-                        break
-            
-            # Bearish displacement - look for last bullish candle
-            elif curr_close < prev_close:
-                for j in range(i-1, max(i-lookback, 0), -1):
-                    if df['close'].iloc[j] > df['open'].iloc[j]:  # Bullish candle
-                        order_blocks.append({
-                            'type': 'bearish_ob',
-                            'start_idx': j,
-                            'end_idx': i,
-                            'high': df['high'].iloc[j],
-                            'low': df['low'].iloc[j],
-                            'strength': displacement,
-                            'timestamp': df.index[j]
-                        })
-                        break
-    
+
+    n = len(close)
+    if n <= lookback:
+        return order_blocks
+
+    # Bar-over-bar percent change in one diff (the NaN head compares
+    # false); callers that already have it pass it in
+    if pct_change is None:
+        pct_change = _pct_change(close)
+
+    events = np.flatnonzero(np.abs(pct_change) > displacement_threshold)
+    events = events[events >= lookback]
+    if len(events) == 0:
+        return order_blocks
+
+    # Sorted indices of bearish/bullish candles, classified in one pass;
+    # the most recent opposite candle before each event is then one
+    # binary search away
+    bearish_idx = np.flatnonzero(close < open_)
+    bullish_idx = np.flatnonzero(close > open_)
+
+    for i in events:
+        i = int(i)
+        strength = abs(pct_change[i])
+
+        # Bullish displacement - look for last bearish candle
+        if pct_change[i] > 0:
+            opposite_idx, ob_type = bearish_idx, 'bullish_ob'
+        # Bearish displacement - look for last bullish candle
+        else:
+            opposite_idx, ob_type = bullish_idx, 'bearish_ob'
+
+        pos = np.searchsorted(opposite_idx, i) - 1
+        if pos < 0:
+            continue
+        j = int(opposite_idx[pos])
+        if j <= max(i - lookback, 0):
+            continue
+
+        order_blocks.append({
+            'type': ob_type,
+            'start_idx': j,
+            'end_idx': i,
+            'high': high[j],
+            'low': low[j],
+            'strength': strength,
+            'timestamp': index[j]
+        })
+
     return order_blocks
 
 def detect_fair_value_gaps(df):
     """
     Detect Fair Value Gaps (FVG) - 3 candle pattern with gap
-    
+
     Returns:
         List of dicts with {type, start_idx, end_idx, gap_high, gap_low}
     """
+    return _detect_fair_value_gaps_arr(df['high'].to_numpy(),
+                                       df['low'].to_numpy(), df.index)
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _fvg_scan(high, low):
+    """
+    Single fused pass over the 3-bar FVG stencil: compare and emit in
+    one loop, writing gap starts into a preallocated buffer through a
+    cursor. Returns (starts, is_bull) sliced to the event count, in
+    chronological order.
+    """
+    n = len(high)
+    starts = np.empty(n, dtype=np.int64)
+    is_bull = np.empty(n, dtype=np.bool_)
+    k = 0
+    for i in range(n - 2):
+        if low[i+2] > high[i]:
+            starts[k] = i
+            is_bull[k] = True
+            k += 1
+        elif high[i+2] < low[i]:
+            starts[k] = i
+            is_bull[k] = False
+            k += 1
+    return starts[:k], is_bull[:k]
+
+def _detect_fair_value_gaps_arr(high, low, index):
+    """FVG detection over preconverted column arrays"""
     fvgs = []
-    
-    for i in range(2, len(df)):
-        candle1_high = df['high'].iloc[i-2]
-        candle1_low = df['low'].iloc[i-2]
-        candle3_high = df['high'].iloc[i]
-        candle3_low = df['low'].iloc[i]
-        
-        # Bullish FVG: gap between candle 1 high and candle 3 low
-        if candle3_low > candle1_high:
+
+    if len(high) < 3:
+        return fvgs
+
+    if NUMBA_AVAILABLE:
+        starts, is_bull = _fvg_scan(high, low)
+    else:
+        # Candle 1 vs candle 3 comparisons for every 3-bar window at
+        # once: bullish FVG gaps candle 1 high to candle 3 low, bearish
+        # the mirror, merged chronologically (mutually exclusive masks)
+        bull_starts = np.flatnonzero(low[2:] > high[:-2])
+        bear_starts = np.flatnonzero(high[2:] < low[:-2])
+        starts = np.concatenate([bull_starts, bear_starts])
+        is_bull = np.concatenate([np.ones(len(bull_starts), dtype=bool),
+                                  np.zeros(len(bear_starts), dtype=bool)])
+        order = np.argsort(starts, kind='stable')
+        starts, is_bull = starts[order], is_bull[order]
+
+    for start, bullish in zip(starts, is_bull):
+        start = int(start)
+        if bullish:
             fvgs.append({
                 'type': 'bullish_fvg',
-                'start_idx': i-2,
-                'end_idx': i,
-                'gap_high': candle3_low,
-                'gap_low': candle1_high,
-                'timestamp': df.index[i-2]
+                'start_idx': start,
+                'end_idx': start + 2,
+                'gap_high': low[start+2],
+                'gap_low': high[start],
+                'timestamp': index[start]
             })
-        
-        # Bearish FVG: gap between candle 1 low and candle 3 high
-        elif candle3_high < candle1_low:
+        else:
             fvgs.append({
                 'type': 'bearish_fvg',
-                'start_idx': i-2,
-                'end_idx': i,
-                'gap_high': candle1_low,
-                'gap_low': candle3_high,
-                'timestamp': df.index[i-2]
+                'start_idx': start,
+                'end_idx': start + 2,
+                'gap_high': low[start],
+                'gap_low': high[start+2],
+                'timestamp': index[start]
             })
-    
+
     return fvgs
 
+@njit(cache=True, nogil=True, fastmath=True)
+def _rolling_max_min(high, low, window):
+    """
+    O(n) trailing-window rolling max of high and min of low
+
+    Position i holds the extreme over [i-window, i) - the window excludes
+    the current bar, matching the original slice. Uses two monotonic
+    index deques backed by fixed arrays.
+    """
+    n = len(high)
+    rmax = np.full(n, np.nan)
+    rmin = np.full(n, np.nan)
+
+    dq_max = np.empty(n, dtype=np.int64)
+    dq_min = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+
+    for i in range(1, n):
+        # Bar i-1 enters the window for position i
+        while max_tail > max_head and high[dq_max[max_tail-1]] <= high[i-1]:
+            max_tail -= 1
+        dq_max[max_tail] = i - 1
+        max_tail += 1
+
+        while min_tail > min_head and low[dq_min[min_tail-1]] >= low[i-1]:
+            min_tail -= 1
+        dq_min[min_tail] = i - 1
+        min_tail += 1
+
+        # Expire bars that fell out of [i-window, i)
+        while dq_max[max_head] < i - window:
+            max_head += 1
+        while dq_min[min_head] < i - window:
+            min_head += 1
+
+        if i >= window:
+            rmax[i] = high[dq_max[max_head]]
+            rmin[i] = low[dq_min[min_head]]
+
+    return rmax, rmin
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _fused_scan_range(high, low, sweep_lb, disp_lb, bpr_lb, start, end,
+                      recent_high, recent_low, avg_range,
+                      bpr_high_max, bpr_low_min, bpr_high_std, bpr_low_std):
+    """
+    Fill output rows [start, end) of the fused rolling statistics: max/min
+    of high/low over the sweep window (monotonic deques), mean candle
+    range over the displacement window (rolling sum), and max/min/std of
+    high/low over the BPR window (deques plus rolling sum/sum-of-squares).
+    Each update is O(1) per bar.
+
+    Position i of every output covers [i-window, i) - the window excludes
+    the current bar - with NaN until the window is full. When start > 0
+    the scan warms up from start minus the largest window, so any chunking
+    of [0, n) into ranges reproduces the full sequential pass.
+    """
+    warm = start - max(sweep_lb, disp_lb, bpr_lb)
+    if warm < 0:
+        warm = 0
+    m = end - warm
+
+    dq_shi = np.empty(m, dtype=np.int64)  # sweep-window high max
+    dq_slo = np.empty(m, dtype=np.int64)  # sweep-window low min
+    dq_bhi = np.empty(m, dtype=np.int64)  # BPR-window high max
+    dq_blo = np.empty(m, dtype=np.int64)  # BPR-window low min
+    shi_head = shi_tail = slo_head = slo_tail = 0
+    bhi_head = bhi_tail = blo_head = blo_tail = 0
+
+    range_sum = 0.0
+    hi_sum = hi_sumsq = 0.0
+    lo_sum = lo_sumsq = 0.0
+
+    for i in range(warm + 1, end):
+        j = i - 1  # bar entering every trailing window
+
+        # Sweep-window deques
+        while shi_tail > shi_head and high[dq_shi[shi_tail-1]] <= high[j]:
+            shi_tail -= 1
+        dq_shi[shi_tail] = j
+        shi_tail += 1
+        while slo_tail > slo_head and low[dq_slo[slo_tail-1]] >= low[j]:
+            slo_tail -= 1
+        dq_slo[slo_tail] = j
+        slo_tail += 1
+        while dq_shi[shi_head] < i - sweep_lb:
+            shi_head += 1
+        while dq_slo[slo_head] < i - sweep_lb:
+            slo_head += 1
+        if i >= start and i >= sweep_lb:
+            recent_high[i] = high[dq_shi[shi_head]]
+            recent_low[i] = low[dq_slo[slo_head]]
+
+        # Displacement-window rolling mean of candle range
+        range_sum += high[j] - low[j]
+        if j - disp_lb >= warm:
+            range_sum -= high[j-disp_lb] - low[j-disp_lb]
+        if i >= start and i >= disp_lb:
+            avg_range[i] = range_sum / disp_lb
+
+        # BPR-window deques and sum/sum-of-squares
+        while bhi_tail > bhi_head and high[dq_bhi[bhi_tail-1]] <= high[j]:
+            bhi_tail -= 1
+        dq_bhi[bhi_tail] = j
+        bhi_tail += 1
+        while blo_tail > blo_head and low[dq_blo[blo_tail-1]] >= low[j]:
+            blo_tail -= 1
+        dq_blo[blo_tail] = j
+        blo_tail += 1
+        while dq_bhi[bhi_head] < i - bpr_lb:
+            bhi_head += 1
+        while dq_blo[blo_head] < i - bpr_lb:
+            blo_head += 1
+
+        hi_sum += high[j]
+        hi_sumsq += high[j] * high[j]
+        lo_sum += low[j]
+        lo_sumsq += low[j] * low[j]
+        if j - bpr_lb >= warm:
+            hi_sum -= high[j-bpr_lb]
+            hi_sumsq -= high[j-bpr_lb] * high[j-bpr_lb]
+            lo_sum -= low[j-bpr_lb]
+            lo_sumsq -= low[j-bpr_lb] * low[j-bpr_lb]
+        if i >= start and i >= bpr_lb and bpr_lb > 1:
+            bpr_high_max[i] = high[dq_bhi[bhi_head]]
+            bpr_low_min[i] = low[dq_blo[blo_head]]
+            # Sample variance (ddof=1), clipped against rounding drift
+            hi_var = (hi_sumsq - hi_sum * hi_sum / bpr_lb) / (bpr_lb - 1)
+            lo_var = (lo_sumsq - lo_sum * lo_sum / bpr_lb) / (bpr_lb - 1)
+            bpr_high_std[i] = np.sqrt(hi_var) if hi_var > 0 else 0.0
+            bpr_low_std[i] = np.sqrt(lo_var) if lo_var > 0 else 0.0
+
+# Frames below this size run the fused scan sequentially; the parallel
+# version's per-chunk warm-up only pays off on large histories
+_PARALLEL_MIN_BARS = 50_000
+_PARALLEL_CHUNK = 16_384
+
+@njit(cache=True, nogil=True, fastmath=True, parallel=True)
+def _fused_rolling_scan_par(high, low, sweep_lb, disp_lb, bpr_lb, chunk_size):
+    """
+    Parallel fused rolling scan: tiles [0, n) into chunks processed
+    concurrently with prange. Each chunk warms its rolling state up from
+    chunk start minus the largest window and writes only its own output
+    rows, so no synchronization is needed and the result matches the
+    sequential pass.
+    """
+    n = len(high)
+    recent_high = np.full(n, np.nan)
+    recent_low = np.full(n, np.nan)
+    avg_range = np.full(n, np.nan)
+    bpr_high_max = np.full(n, np.nan)
+    bpr_low_min = np.full(n, np.nan)
+    bpr_high_std = np.full(n, np.nan)
+    bpr_low_std = np.full(n, np.nan)
+
+    num_chunks = (n + chunk_size - 1) // chunk_size
+    for ci in prange(num_chunks):
+        start = ci * chunk_size
+        end = min(start + chunk_size, n)
+        _fused_scan_range(high, low, sweep_lb, disp_lb, bpr_lb, start, end,
+                          recent_high, recent_low, avg_range,
+                          bpr_high_max, bpr_low_min,
+                          bpr_high_std, bpr_low_std)
+
+    return (recent_high, recent_low, avg_range,
+            bpr_high_max, bpr_low_min, bpr_high_std, bpr_low_std)
+
+def _fused_rolling_scan(high, low, sweep_lb, disp_lb, bpr_lb):
+    """
+    Fused rolling statistics for the sweep/displacement/BPR detectors,
+    dispatching to the parallel tiled kernel on large frames.
+
+    Returns:
+        Tuple of (recent_high, recent_low, avg_range, bpr_high_max,
+        bpr_low_min, bpr_high_std, bpr_low_std) arrays
+    """
+    n = len(high)
+    if NUMBA_AVAILABLE and n >= _PARALLEL_MIN_BARS:
+        return _fused_rolling_scan_par(high, low, sweep_lb, disp_lb,
+                                       bpr_lb, _PARALLEL_CHUNK)
+
+    recent_high = np.full(n, np.nan)
+    recent_low = np.full(n, np.nan)
+    avg_range = np.full(n, np.nan)
+    bpr_high_max = np.full(n, np.nan)
+    bpr_low_min = np.full(n, np.nan)
+    bpr_high_std = np.full(n, np.nan)
+    bpr_low_std = np.full(n, np.nan)
+
+    _fused_scan_range(high, low, sweep_lb, disp_lb, bpr_lb, 0, n,
+                      recent_high, recent_low, avg_range,
+                      bpr_high_max, bpr_low_min, bpr_high_std, bpr_low_std)
+
+    return (recent_high, recent_low, avg_range,
+            bpr_high_max, bpr_low_min, bpr_high_std, bpr_low_std)
+
 def detect_liquidity_sweeps(df, lookback=50, sweep_threshold=0.001):
     """
     Detect Liquidity Sweeps - price sweeps high/low then reverses
-    
+
     Returns:
         List of dicts with {type, idx, price, reversal}
     """
+    n = len(df)
+    if n <= lookback + 1:
+        return []
+
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+
+    recent_high, recent_low = _rolling_max_min(high, low, lookback)
+    return _build_sweeps(high, low, close, recent_high, recent_low,
+                         lookback, sweep_threshold, df.index)
+
+def _build_sweeps(high, low, close, recent_high, recent_low,
+                  lookback, sweep_threshold, index):
+    """Build the sweep event list from precomputed rolling extremes"""
     sweeps = []
-    
-    for i in range(lookback, len(df) - 1):
-        # Find recent high/low
-        recent_high = df['high'].iloc[i-lookback:i].max()
-        recent_low = df['low'].iloc[i-lookback:i].min()
-        
-        curr_high = df['high'].iloc[i]
-        curr_low = df['low'].iloc[i]
-        next_close = df['close'].iloc[i+1]
-        curr_close = df['close'].iloc[i]
-        
-        # Sweep high then drop (bearish)
-        if curr_high > recent_high * (1 + sweep_threshold):
-            if next_close < curr_close:
-                sweeps.append({
-                    'type': 'high_sweep',
-                    'idx': i,
-                    'price': curr_high,
-                    'reversal': 'bearish',
-                    'timestamp': df.index[i]
-                })
-        
-        # Sweep low then rally (bullish)
-        if curr_low < recent_low * (1 - sweep_threshold):
-            if next_close > curr_close:
-                sweeps.append({
-                    'type': 'low_sweep',
-                    'idx': i,
-                    'price': curr_low,
-                    'reversal': 'bullish',
-                    'timestamp': df.index[i]
-                })
-    
+
+    n = len(high)
+    if n <= lookback + 1:
+        return sweeps
+
+    # Sweep high then drop (bearish) / sweep low then rally (bullish);
+    # only bars [lookback, n-1) have both a full window and a next close
+    high_sweep = np.zeros(n, dtype=bool)
+    low_sweep = np.zeros(n, dtype=bool)
+    span = slice(lookback, n - 1)
+    high_sweep[span] = ((high[span] > recent_high[span] * (1 + sweep_threshold)) &
+                       (close[lookback+1:n] < close[span]))
+    low_sweep[span] = ((low[span] < recent_low[span] * (1 - sweep_threshold)) &
+                      (close[lookback+1:n] > close[span]))
+
+    # Merge chronologically; a high sweep sorts before a low sweep on the
+    # same bar, as in the original scan
+    high_idx = np.flatnonzero(high_sweep)
+    low_idx = np.flatnonzero(low_sweep)
+    all_idx = np.concatenate([high_idx, low_idx])
+    is_high = np.concatenate([np.ones(len(high_idx), dtype=bool),
+                              np.zeros(len(low_idx), dtype=bool)])
+    order = np.argsort(all_idx, kind='stable')
+
+    for i, is_high_sweep in zip(all_idx[order], is_high[order]):
+        i = int(i)
+        if is_high_sweep:
+            sweeps.append({
+                'type': 'high_sweep',
+                'idx': i,
+                'price': high[i],
+                'reversal': 'bearish',
+                'timestamp': index[i]
+            })
+        else:
+            sweeps.append({
+                'type': 'low_sweep',
+                'idx': i,
+                'price': low[i],
+                'reversal': 'bullish',
+                'timestamp': index[i]
+            })
+
     return sweeps
 
 def detect_market_structure_shift(df, swing_length=5):
@@ -152,67 +460,115 @@ def detect_market_structure_shift(df, swing_length=5):
     Returns:
         List of dicts with {type, idx, price, structure_type}
     """
+    return _detect_market_structure_shift_arr(df['high'].to_numpy(),
+                                              df['low'].to_numpy(),
+                                              df['close'].to_numpy(),
+                                              df.index, swing_length)
+
+def _detect_market_structure_shift_arr(highs, lows, close, index, swing_length):
+    """MSS/BOS detection over preconverted column arrays"""
     structure_shifts = []
-    swing_highs = []
-    swing_lows = []
-    
-    # Find swing highs and lows
-    for i in range(swing_length, len(df) - swing_length):
-        # Swing high
-        if df['high'].iloc[i] == df['high'].iloc[i-swing_length:i+swing_length+1].max():
-            swing_highs.append({'idx': i, 'price': df['high'].iloc[i]})
-        
-        # Swing low
-        if df['low'].iloc[i] == df['low'].iloc[i-swing_length:i+swing_length+1].min():
-            swing_lows.append({'idx': i, 'price': df['low'].iloc[i]})
-    
-    # Detect structure breaks
-    for i in range(len(df)):
-        curr_price = df['close'].iloc[i]
-        
-        # Check if recent swing high broken (bullish BOS/continuation)
-        for sh in swing_highs:
-            if sh['idx'] < i and curr_price > sh['price']:
-                structure_shifts.append({
-                    'type': 'bos',
-                    'direction': 'bullish',
-                    'idx': i,
-                    'price': curr_price,
-                    'broken_level': sh['price'],
-                    'timestamp': df.index[i]
-                })
-                break
-        
-        # Check if recent swing low broken (bearish BOS/continuation)
-        for sl in swing_lows:
-            if sl['idx'] < i and curr_price < sl['price']:
-                structure_shifts.append({
-                    'type': 'bos',
-                    'direction': 'bearish',
-                    'idx': i,
-                    'price': curr_price,
-                    'broken_level': sl['price'],
-                    'timestamp': df.index[i]
-                })
-                break
+
+    n = len(highs)
+
+    # Find swing highs and lows: a bar is a swing iff it equals the
+    # extreme of the 2L+1 window centered on it. bottleneck's O(n)
+    # running extreme replaces argrelextrema's O(n*L) comparisons; both
+    # paths clip the boundary bars that lack a full window on both sides.
+    L = swing_length
+    w = 2 * L + 1
+    if BOTTLENECK_AVAILABLE and n >= w:
+        # move_max position i covers [i-w+1, i], so the window centered
+        # on bar c ends at c+L
+        cmax = bn.move_max(highs, w)
+        cmin = bn.move_min(lows, w)
+        sh_idx = np.flatnonzero(highs[L:n-L] == cmax[2*L:]) + L
+        sl_idx = np.flatnonzero(lows[L:n-L] == cmin[2*L:]) + L
+    else:
+        sh_idx = argrelextrema(highs, np.greater_equal, order=L)[0]
+        sl_idx = argrelextrema(lows, np.less_equal, order=L)[0]
+        sh_idx = sh_idx[(sh_idx >= L) & (sh_idx < n - L)]
+        sl_idx = sl_idx[(sl_idx >= L) & (sl_idx < n - L)]
+
+    swing_highs = [{'idx': int(i), 'price': highs[i]} for i in sh_idx]
+    swing_lows = [{'idx': int(i), 'price': lows[i]} for i in sl_idx]
     
+    # Detect structure breaks: at each bar, compare the close against the
+    # running extreme of all swing levels formed so far. The cumulative
+    # max/min plus a searchsorted alignment replaces the per-bar scan
+    # over the whole swing list.
+    bars = np.arange(n)
+
+    bull_mask = np.zeros(n, dtype=bool)
+    bear_mask = np.zeros(n, dtype=bool)
+    bull_level = np.empty(n)
+    bear_level = np.empty(n)
+
+    if len(sh_idx) > 0:
+        # Check if a prior swing high is broken (bullish BOS/continuation)
+        running_max = np.maximum.accumulate(highs[sh_idx])
+        align = np.searchsorted(sh_idx, bars, side='left') - 1
+        has_swing = align >= 0
+        bull_level[has_swing] = running_max[align[has_swing]]
+        bull_mask = has_swing & (close > np.where(has_swing, bull_level, np.inf))
+
+    if len(sl_idx) > 0:
+        # Check if a prior swing low is broken (bearish BOS/continuation)
+        running_min = np.minimum.accumulate(lows[sl_idx])
+        align = np.searchsorted(sl_idx, bars, side='left') - 1
+        has_swing = align >= 0
+        bear_level[has_swing] = running_min[align[has_swing]]
+        bear_mask = has_swing & (close < np.where(has_swing, bear_level, -np.inf))
+
+    # Merge chronologically, bullish before bearish on the same bar
+    bull_bars = np.flatnonzero(bull_mask)
+    bear_bars = np.flatnonzero(bear_mask)
+    all_bars = np.concatenate([bull_bars, bear_bars])
+    is_bull = np.concatenate([np.ones(len(bull_bars), dtype=bool),
+                              np.zeros(len(bear_bars), dtype=bool)])
+    order = np.argsort(all_bars, kind='stable')
+
+    for i, bullish in zip(all_bars[order], is_bull[order]):
+        i = int(i)
+        structure_shifts.append({
+            'type': 'bos',
+            'direction': 'bullish' if bullish else 'bearish',
+            'idx': i,
+            'price': close[i],
+            'broken_level': bull_level[i] if bullish else bear_level[i],
+            'timestamp': index[i]
+        })
+
     return structure_shifts
 
+# OTE Fibonacci retracement ratios, in the order the dict form reports
+OTE_LEVEL_NAMES = ('62%', '70.5%', '79%', '50%')
+OTE_RATIOS = np.array([0.62, 0.705, 0.79, 0.50])
+
+def calculate_ote_levels_arr(highs, lows):
+    """
+    Calculate OTE levels for many (high, low) swings in one broadcast
+
+    Args:
+        highs: Array of swing highs
+        lows: Array of swing lows
+
+    Returns:
+        (N, 4) array of levels, columns ordered as OTE_LEVEL_NAMES
+    """
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
+    return lows[:, None] + (highs - lows)[:, None] * OTE_RATIOS[None, :]
+
 def calculate_ote_levels(high, low):
     """
     Calculate Optimal Trade Entry levels (Fibonacci retracements)
-    
+
     Returns:
         Dict with OTE levels
     """
-    diff = high - low
-    
-    return {
-        '62%': low + (diff * 0.62),
-        '70.5%': low + (diff * 0.705),
-        '79%': low + (diff * 0.79),
-        '50%': low + (diff * 0.50)
-    }
+    levels = calculate_ote_levels_arr(np.array([high]), np.array([low]))[0]
+    return dict(zip(OTE_LEVEL_NAMES, levels))
 
 def detect_displacement(df, lookback=10, threshold=0.02):
     """
@@ -221,28 +577,56 @@ def detect_displacement(df, lookback=10, threshold=0.02):
     Returns:
         List of dicts with {type, idx, magnitude, strength}
     """
+    n = len(df)
+    if n <= lookback:
+        return []
+
+    high = df['high'].to_numpy()
+    low = df['low'].to_numpy()
+    close = df['close'].to_numpy()
+    open_ = df['open'].to_numpy()
+
+    # Trailing average range, shifted so bar i sees [i-lookback, i)
+    curr_range = high - low
+    if BOTTLENECK_AVAILABLE:
+        avg_range = _shift1(bn.move_mean(curr_range, lookback))
+    else:
+        avg_range = pd.Series(curr_range).rolling(lookback).mean().shift(1).to_numpy()
+
+    return _build_displacements(open_, high, low, close, avg_range,
+                                threshold, df.index)
+
+def _build_displacements(open_, high, low, close, avg_range, threshold,
+                         index, pct_change=None):
+    """Build the displacement event list from a precomputed average range"""
     displacements = []
-    
-    for i in range(lookback, len(df)):
-        # Calculate average candle size
-        avg_range = df['high'].iloc[i-lookback:i].sub(df['low'].iloc[i-lookback:i]).mean()
-        
-        curr_range = df['high'].iloc[i] - df['low'].iloc[i]
-        body_size = abs(df['close'].iloc[i] - df['open'].iloc[i])
-        
-        # Strong move with large body
-        if curr_range > avg_range * 1.5 and body_size / curr_range > 0.7:
-            price_change = (df['close'].iloc[i] - df['close'].iloc[i-1]) / df['close'].iloc[i-1]
-            
-            if abs(price_change) > threshold:
-                displacements.append({
-                    'type': 'bullish' if price_change > 0 else 'bearish',
-                    'idx': i,
-                    'magnitude': price_change,
-                    'strength': body_size / avg_range,
-                    'timestamp': df.index[i]
-                })
-    
+
+    n = len(high)
+    if n < 2:
+        return displacements
+
+    curr_range = high - low
+    body_size = np.abs(close - open_)
+
+    if pct_change is None:
+        pct_change = _pct_change(close)
+
+    # Strong move with large body (NaN head of avg_range compares false)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mask = ((curr_range > avg_range * 1.5) &
+                (body_size / curr_range > 0.7) &
+                (np.abs(pct_change) > threshold))
+
+    for i in np.flatnonzero(mask):
+        i = int(i)
+        displacements.append({
+            'type': 'bullish' if pct_change[i] > 0 else 'bearish',
+            'idx': i,
+            'magnitude': pct_change[i],
+            'strength': body_size[i] / avg_range[i],
+            'timestamp': index[i]
+        })
+
     return displacements
 
 def detect_bpr(df, lookback=20, tolerance=0.005):
@@ -252,26 +636,48 @@ def detect_bpr(df, lookback=20, tolerance=0.005):
     Returns:
         List of dicts with {start_idx, end_idx, high, low}
     """
+    if len(df) <= lookback:
+        return []
+
+    # Rolling stats shifted so bar i sees the window [i-lookback, i)
+    if BOTTLENECK_AVAILABLE:
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        high_range = _shift1(bn.move_max(high, lookback))
+        low_range = _shift1(bn.move_min(low, lookback))
+        high_std = _shift1(bn.move_std(high, lookback, ddof=1))
+        low_std = _shift1(bn.move_std(low, lookback, ddof=1))
+    else:
+        high_roll = df['high'].rolling(lookback)
+        low_roll = df['low'].rolling(lookback)
+        high_range = high_roll.max().shift(1).to_numpy()
+        low_range = low_roll.min().shift(1).to_numpy()
+        high_std = high_roll.std().shift(1).to_numpy()
+        low_std = low_roll.std().shift(1).to_numpy()
+
+    return _build_bprs(high_range, low_range, high_std, low_std,
+                       lookback, tolerance, df.index)
+
+def _build_bprs(high_range, low_range, high_std, low_std,
+                lookback, tolerance, index):
+    """Build the BPR zone list from precomputed rolling range stats"""
     bprs = []
-    
-    for i in range(lookback, len(df)):
-        window = df.iloc[i-lookback:i]
-        high_range = window['high'].max()
-        low_range = window['low'].min()
-        
-        # Check if highs and lows are relatively equal
-        high_std = window['high'].std()
-        low_std = window['low'].std()
-        
-        if high_std / high_range < tolerance and low_std / low_range < tolerance:
-            bprs.append({
-                'start_idx': i-lookback,
-                'end_idx': i,
-                'high': high_range,
-                'low': low_range,
-                'timestamp': df.index[i-lookback]
-            })
-    
+
+    # Check if highs and lows are relatively equal (NaN head is false)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mask = ((high_std / high_range < tolerance) &
+                (low_std / low_range < tolerance))
+
+    for i in np.flatnonzero(mask):
+        i = int(i)
+        bprs.append({
+            'start_idx': i-lookback,
+            'end_idx': i,
+            'high': high_range[i],
+            'low': low_range[i],
+            'timestamp': index[i-lookback]
+        })
+
     return bprs
 
 def detect_volume_imbalance(df):
@@ -281,51 +687,444 @@ def detect_volume_imbalance(df):
     Returns:
         List of dicts with {type, idx, gap_high, gap_low}
     """
+    return _detect_volume_imbalance_arr(df['high'].to_numpy(),
+                                        df['low'].to_numpy(), df.index)
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _volume_imbalance_scan(high, low):
+    """
+    Single fused pass over the 3-bar volume-imbalance stencil, emitting
+    event bars through a cursor into a preallocated buffer. Returns
+    (bars, is_bull) sliced to the event count, in chronological order.
+    """
+    n = len(high)
+    bars = np.empty(n, dtype=np.int64)
+    is_bull = np.empty(n, dtype=np.bool_)
+    k = 0
+    for i in range(1, n - 1):
+        if low[i] > high[i-1] and low[i] > high[i+1]:
+            bars[k] = i
+            is_bull[k] = True
+            k += 1
+        elif high[i] < low[i-1] and high[i] < low[i+1]:
+            bars[k] = i
+            is_bull[k] = False
+            k += 1
+    return bars[:k], is_bull[:k]
+
+def _detect_volume_imbalance_arr(high, low, index):
+    """Volume-imbalance detection over preconverted column arrays"""
     imbalances = []
-    
-    for i in range(1, len(df) - 1):
-        prev_high = df['high'].iloc[i-1]
-        prev_low = df['low'].iloc[i-1]
-        curr_high = df['high'].iloc[i]
-        curr_low = df['low'].iloc[i]
-        next_high = df['high'].iloc[i+1]
-        next_low = df['low'].iloc[i+1]
-        
-        # Bullish imbalance: current candle doesn't overlap with previous or next
-        if curr_low > prev_high and curr_low > next_high:
+
+    if len(high) < 3:
+        return imbalances
+
+    if NUMBA_AVAILABLE:
+        all_bars, is_bull = _volume_imbalance_scan(high, low)
+    else:
+        # 3-bar stencil as shifted slices (position j maps to bar j+1):
+        # a bullish imbalance candle doesn't overlap its neighbors,
+        # bearish is the mirror (the two masks are mutually exclusive)
+        bull_mask = (low[1:-1] > high[:-2]) & (low[1:-1] > high[2:])
+        bear_mask = (high[1:-1] < low[:-2]) & (high[1:-1] < low[2:])
+        bull_bars = np.flatnonzero(bull_mask) + 1
+        bear_bars = np.flatnonzero(bear_mask) + 1
+        all_bars = np.concatenate([bull_bars, bear_bars])
+        is_bull = np.concatenate([np.ones(len(bull_bars), dtype=bool),
+                                  np.zeros(len(bear_bars), dtype=bool)])
+        order = np.argsort(all_bars, kind='stable')
+        all_bars, is_bull = all_bars[order], is_bull[order]
+
+    for i, bullish in zip(all_bars, is_bull):
+        i = int(i)
+        if bullish:
             imbalances.append({
                 'type': 'bullish_imbalance',
                 'idx': i,
-                'gap_high': curr_low,
-                'gap_low': max(prev_high, next_high),
-                'timestamp': df.index[i]
+                'gap_high': low[i],
+                'gap_low': max(high[i-1], high[i+1]),
+                'timestamp': index[i]
             })
-        
-        # Bearish imbalance
-        elif curr_high < prev_low and curr_high < next_low:
+        else:
             imbalances.append({
                 'type': 'bearish_imbalance',
                 'idx': i,
-                'gap_high': min(prev_low, next_low),
-                'gap_low': curr_high,
-                'timestamp': df.index[i]
+                'gap_high': min(low[i-1], low[i+1]),
+                'gap_low': high[i],
+                'timestamp': index[i]
             })
-    
+
     return imbalances
 
+class ICTState:
+    """
+    Incremental ICT detection for live bar-by-bar updates
+
+    The batch detectors rescan the whole history on every call, which is
+    O(n) per new bar in a live session. ICTState keeps a short trailing
+    buffer (bounded by the largest detector window) plus running swing
+    extremes, and update() emits only the events a new bar completes, in
+    O(lookback) work per bar.
+
+    Events carry absolute bar indices and match the dict schema of the
+    batch detectors. One deliberate difference: the batch market
+    structure scan can see a swing before its confirming bars exist,
+    so in live mode a break against a swing formed fewer than
+    swing_length bars ago surfaces only once that swing is confirmed.
+    """
+
+    def __init__(self, lookback=20, displacement_threshold=0.015,
+                 sweep_lookback=50, sweep_threshold=0.001, swing_length=5,
+                 displacement_lookback=10, displacement_move=0.02,
+                 bpr_lookback=20, bpr_tolerance=0.005):
+        self.lookback = lookback
+        self.displacement_threshold = displacement_threshold
+        self.sweep_lookback = sweep_lookback
+        self.sweep_threshold = sweep_threshold
+        self.swing_length = swing_length
+        self.displacement_lookback = displacement_lookback
+        self.displacement_move = displacement_move
+        self.bpr_lookback = bpr_lookback
+        self.bpr_tolerance = bpr_tolerance
+
+        # Trailing buffers plus the absolute index of their first bar
+        self._keep = max(sweep_lookback + 2, lookback + 2,
+                         bpr_lookback + 2, displacement_lookback + 2,
+                         2 * swing_length + 1)
+        self._open = []
+        self._high = []
+        self._low = []
+        self._close = []
+        self._stamps = []
+        self._offset = 0  # absolute index of buffer position 0
+        self._count = 0   # total bars seen
+
+        # Running extremes over confirmed swing highs/lows
+        self._swing_max = -np.inf
+        self._swing_min = np.inf
+
+    def _abs(self, buf_pos):
+        """Absolute bar index of a buffer position"""
+        return self._offset + buf_pos
+
+    def update(self, open_, high, low, close, timestamp):
+        """
+        Append one bar and return the events it completes
+
+        Args:
+            open_, high, low, close: Bar prices
+            timestamp: Bar timestamp (carried into the event dicts)
+
+        Returns:
+            Dict with the same keys as get_all_ict_indicators, each a
+            list of newly completed events (usually empty)
+        """
+        self._open.append(float(open_))
+        self._high.append(float(high))
+        self._low.append(float(low))
+        self._close.append(float(close))
+        self._stamps.append(timestamp)
+        self._count += 1
+        if len(self._close) > self._keep:
+            drop = len(self._close) - self._keep
+            del self._open[:drop]
+            del self._high[:drop]
+            del self._low[:drop]
+            del self._close[:drop]
+            del self._stamps[:drop]
+            self._offset += drop
+
+        o, h, l, c = self._open, self._high, self._low, self._close
+        t = len(c) - 1           # buffer position of the new bar
+        T = self._abs(t)         # absolute index of the new bar
+
+        events = {
+            'order_blocks': [],
+            'fair_value_gaps': [],
+            'liquidity_sweeps': [],
+            'market_structure': [],
+            'displacements': [],
+            'bpr': [],
+            'volume_imbalances': []
+        }
+
+        # Order block: strong move into the new bar, last opposite candle
+        # within the lookback window before it
+        if t >= 1 and T >= self.lookback:
+            pct = (c[t] - c[t-1]) / c[t-1]
+            if abs(pct) > self.displacement_threshold:
+                bullish = pct > 0
+                floor = max(T - self.lookback, 0)  # absolute, exclusive
+                for j in range(t - 1, -1, -1):
+                    if self._abs(j) <= floor:
+                        break
+                    opposite = c[j] < o[j] if bullish else c[j] > o[j]
+                    if opposite:
+                        events['order_blocks'].append({
+                            'type': 'bullish_ob' if bullish else 'bearish_ob',
+                            'start_idx': self._abs(j),
+                            'end_idx': T,
+                            'high': h[j],
+                            'low': l[j],
+                            'strength': abs(pct),
+                            'timestamp': self._stamps[j]
+                        })
+                        break
+
+        # FVG: the new bar closes a 3-candle gap starting two bars back
+        if t >= 2:
+            if l[t] > h[t-2]:
+                events['fair_value_gaps'].append({
+                    'type': 'bullish_fvg',
+                    'start_idx': T - 2,
+                    'end_idx': T,
+                    'gap_high': l[t],
+                    'gap_low': h[t-2],
+                    'timestamp': self._stamps[t-2]
+                })
+            elif h[t] < l[t-2]:
+                events['fair_value_gaps'].append({
+                    'type': 'bearish_fvg',
+                    'start_idx': T - 2,
+                    'end_idx': T,
+                    'gap_high': l[t-2],
+                    'gap_low': h[t],
+                    'timestamp': self._stamps[t-2]
+                })
+
+        # Liquidity sweep: the previous bar swept the trailing extreme
+        # and the new close confirms the reversal
+        s = t - 1
+        if s >= 1 and self._abs(s) >= self.sweep_lookback:
+            win_lo = s - self.sweep_lookback
+            if win_lo >= 0:
+                recent_high = max(h[win_lo:s])
+                recent_low = min(l[win_lo:s])
+                if (h[s] > recent_high * (1 + self.sweep_threshold) and
+                        c[t] < c[s]):
+                    events['liquidity_sweeps'].append({
+                        'type': 'high_sweep',
+                        'idx': self._abs(s),
+                        'price': h[s],
+                        'reversal': 'bearish',
+                        'timestamp': self._stamps[s]
+                    })
+                if (l[s] < recent_low * (1 - self.sweep_threshold) and
+                        c[t] > c[s]):
+                    events['liquidity_sweeps'].append({
+                        'type': 'low_sweep',
+                        'idx': self._abs(s),
+                        'price': l[s],
+                        'reversal': 'bullish',
+                        'timestamp': self._stamps[s]
+                    })
+
+        # Market structure: confirm the swing candidate that now has a
+        # full window on both sides, then test the new close against the
+        # running swing extremes
+        L = self.swing_length
+        cand = t - L
+        if cand >= L:
+            window_h = h[cand-L:cand+L+1]
+            if h[cand] >= max(window_h):
+                self._swing_max = max(self._swing_max, h[cand])
+            window_l = l[cand-L:cand+L+1]
+            if l[cand] <= min(window_l):
+                self._swing_min = min(self._swing_min, l[cand])
+        if self._swing_max > -np.inf and c[t] > self._swing_max:
+            events['market_structure'].append({
+                'type': 'bos',
+                'direction': 'bullish',
+                'idx': T,
+                'price': c[t],
+                'broken_level': self._swing_max,
+                'timestamp': self._stamps[t]
+            })
+        if self._swing_min < np.inf and c[t] < self._swing_min:
+            events['market_structure'].append({
+                'type': 'bos',
+                'direction': 'bearish',
+                'idx': T,
+                'price': c[t],
+                'broken_level': self._swing_min,
+                'timestamp': self._stamps[t]
+            })
+
+        # Displacement: strong wide-bodied move vs the trailing mean range
+        dlb = self.displacement_lookback
+        if t >= dlb:
+            ranges = [h[k] - l[k] for k in range(t - dlb, t)]
+            avg_range = sum(ranges) / dlb
+            curr_range = h[t] - l[t]
+            body = abs(c[t] - o[t])
+            pct = (c[t] - c[t-1]) / c[t-1]
+            if (curr_range > avg_range * 1.5 and curr_range > 0 and
+                    body / curr_range > 0.7 and
+                    abs(pct) > self.displacement_move):
+                events['displacements'].append({
+                    'type': 'bullish' if pct > 0 else 'bearish',
+                    'idx': T,
+                    'magnitude': pct,
+                    'strength': body / avg_range,
+                    'timestamp': self._stamps[t]
+                })
+
+        # BPR: trailing highs and lows are tightly balanced
+        blb = self.bpr_lookback
+        if t >= blb and blb > 1:
+            win_h = np.asarray(h[t-blb:t])
+            win_l = np.asarray(l[t-blb:t])
+            high_range = win_h.max()
+            low_range = win_l.min()
+            high_std = win_h.std(ddof=1)
+            low_std = win_l.std(ddof=1)
+            if (high_range > 0 and low_range > 0 and
+                    high_std / high_range < self.bpr_tolerance and
+                    low_std / low_range < self.bpr_tolerance):
+                events['bpr'].append({
+                    'start_idx': T - blb,
+                    'end_idx': T,
+                    'high': high_range,
+                    'low': low_range,
+                    'timestamp': self._stamps[t-blb]
+                })
+
+        # Volume imbalance: the new bar completes the 3-bar stencil
+        # centered on the previous bar
+        i = t - 1
+        if i >= 1:
+            if l[i] > h[i-1] and l[i] > h[t]:
+                events['volume_imbalances'].append({
+                    'type': 'bullish_imbalance',
+                    'idx': self._abs(i),
+                    'gap_high': l[i],
+                    'gap_low': max(h[i-1], h[t]),
+                    'timestamp': self._stamps[i]
+                })
+            elif h[i] < l[i-1] and h[i] < l[t]:
+                events['volume_imbalances'].append({
+                    'type': 'bearish_imbalance',
+                    'idx': self._abs(i),
+                    'gap_high': min(l[i-1], l[t]),
+                    'gap_low': h[i],
+                    'timestamp': self._stamps[i]
+                })
+
+        return events
+
+def events_to_columns(events, fields=None):
+    """
+    Convert a detector's list of event dicts to a dict of numpy arrays
+
+    Columnar (SoA) layout for consumers that scan many events with
+    vectorized numpy instead of per-dict Python loops.
+
+    Args:
+        events: List of event dicts from a detect_* function
+        fields: Optional iterable of keys to extract (defaults to the
+                keys of the first event)
+
+    Returns:
+        Dict mapping field name to numpy array (empty dict if no events)
+    """
+    if not events:
+        return {}
+    if fields is None:
+        fields = events[0].keys()
+    return {f: np.asarray([e[f] for e in events]) for f in fields}
+
+# Recent get_all_ict_indicators results keyed by a cheap frame
+# fingerprint; repeated calls on the same window (tab reruns, backtest
+# sweeps) return the cached dict instead of rescanning
+_ICT_CACHE = {}
+_ICT_CACHE_MAX = 16
+
+def clear_ict_cache():
+    """Drop all cached indicator results (mainly for test isolation)"""
+    _ICT_CACHE.clear()
+
 def get_all_ict_indicators(df):
     """
     Run all ICT detection algorithms and return results
-    
+
+    Results are cached on a cheap fingerprint of the frame (length,
+    first/last timestamp, last close), so repeat calls on the same
+    window skip the scans entirely; treat the returned dict as
+    read-only. The scans themselves extract the column arrays once and
+    share them across detectors, and the three rolling-statistics
+    detectors (liquidity sweeps, displacement, BPR) share one fused
+    numba pass over the high/low arrays.
+
     Returns:
         Dict with all ICT indicators
     """
-    return {
-        'order_blocks': detect_order_blocks(df),
-        'fair_value_gaps': detect_fair_value_gaps(df),
-        'liquidity_sweeps': detect_liquidity_sweeps(df),
-        'market_structure': detect_market_structure_shift(df),
-        'displacements': detect_displacement(df),
-        'bpr': detect_bpr(df),
-        'volume_imbalances': detect_volume_imbalance(df)
+    try:
+        key = (len(df), df.index[0].value, df.index[-1].value,
+               float(df['close'].iloc[-1]))
+    except (AttributeError, IndexError):
+        key = None  # empty frame or non-datetime index: skip caching
+
+    if key is not None:
+        cached = _ICT_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    result = _get_all_ict_indicators_uncached(df)
+
+    if key is not None:
+        if len(_ICT_CACHE) >= _ICT_CACHE_MAX:
+            _ICT_CACHE.pop(next(iter(_ICT_CACHE)))  # evict the oldest
+        _ICT_CACHE[key] = result
+    return result
+
+def _get_all_ict_indicators_uncached(df):
+    """Run the detector scans without consulting the result cache"""
+    index = df.index
+    open_ = df['open'].to_numpy(dtype=np.float64)
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+
+    # Half-width copies for the compare-only stencil scans (FVG and
+    # volume imbalance): gap comparisons need ~1e-4 precision, well
+    # within float32, and the narrower arrays halve their memory
+    # traffic. The rolling-std stats stay float64 - the BPR tolerance
+    # ratio is sensitive enough for float32 to flip borderline bars.
+    high32 = high.astype(np.float32)
+    low32 = low.astype(np.float32)
+
+    # Percent change computed once and shared by the order-block and
+    # displacement masks
+    pct_change = _pct_change(close)
+
+    # Windows match the standalone detector defaults
+    (recent_high, recent_low, avg_range,
+     bpr_high_max, bpr_low_min,
+     bpr_high_std, bpr_low_std) = _fused_rolling_scan(high, low, 50, 10, 20)
+
+    result = {
+        'order_blocks': _detect_order_blocks_arr(open_, high, low, close,
+                                                 index, 20, 0.015,
+                                                 pct_change=pct_change),
+        'fair_value_gaps': _detect_fair_value_gaps_arr(high32, low32, index),
+        'liquidity_sweeps': _build_sweeps(high, low, close, recent_high,
+                                          recent_low, 50, 0.001, index),
+        'market_structure': _detect_market_structure_shift_arr(high, low,
+                                                               close, index, 5),
+        'displacements': _build_displacements(open_, high, low, close,
+                                              avg_range, 0.02, index,
+                                              pct_change=pct_change),
+        'bpr': _build_bprs(bpr_high_max, bpr_low_min, bpr_high_std,
+                           bpr_low_std, 20, 0.005, index),
+        'volume_imbalances': _detect_volume_imbalance_arr(high32, low32, index)
+    }
+
+    # Bar positions per detector, extracted once; lets
+    # filter_recent_zones apply its recency cutoff as a single
+    # vectorized comparison instead of testing every event
+    result['_idx_arrays'] = {
+        name: np.asarray([e.get('idx', e.get('start_idx', 0)) for e in events],
+                         dtype=np.int64)
+        for name, events in result.items()
     }
+    return result
@@ -4,13 +4,17 @@ MAG7 + SPY Trading Signals using Inner Circle Trader Strategies
 """
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import plotly.graph_objects as go
 
 # Import custom modules
-from data_fetcher import fetch_stock_data, fetch_stock_data_range, get_available_tickers
+from data_fetcher import fetch_stock_data, fetch_stock_data_range, resample_ohlcv, get_available_tickers
 from ict_strategies import get_all_ict_indicators
-from signal_generator import generate_signal, backtest_signal
+from signal_generator import (
+    generate_signal, generate_signals_vectorized,
+    backtest_signal, backtest_signal_at_position, nearest_position
+)
 from chart_builder import create_candlestick_chart, create_backtest_chart
 from signal_explanations import explain_signal_in_detail
 
@@ -22,8 +26,126 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Metric display lookups - one dict.get instead of a string-compare chain
+# on every rerun
+_KZ_DISPLAY = {
+    'NEW_YORK_AM': ("⭐ NY AM (BEST)", "green"),
+    'LONDON_KILLZONE': ("LONDON KILLZONE", "orange"),
+    'NEW_YORK_PM': ("NEW YORK PM", "orange"),
+    'ASIAN_SESSION': ("ASIAN SESSION", "orange"),
+    'OUTSIDE': ("❌ Outside Zones", "gray"),
+}
+_P3_DISPLAY = {
+    'DISTRIBUTION': ("green", "✅"),
+    'MANIPULATION': ("orange", "⚠️"),
+}
+_HTF_DISPLAY = {
+    'BULLISH': ("green", "📈"),
+    'BEARISH': ("red", "📉"),
+}
+
+def _slice_period(df, period):
+    """
+    Trailing view of a master frame matching a yfinance period string
+
+    yfinance period windows are calendar-based (start = end - period), so
+    slicing the long master fetch returns the same bars a direct shorter
+    fetch would.
+    """
+    if df is None or df.empty:
+        return df
+    n = int(period[:-1])
+    offset = pd.DateOffset(years=n) if period.endswith('y') else pd.DateOffset(days=n)
+    return df[df.index >= df.index[-1] - offset]
+
+# Expanders mounted in the signal history before "Show older" is clicked
+HISTORY_PAGE_SIZE = 10
+
+@st.cache_data(show_spinner=False, max_entries=2000)
+def _build_signal_view(when_str, signal, confidence, price_change, entry_price,
+                       correct, reasoning):
+    """
+    Pre-render the display strings for one scanner hit
+
+    Keyed on the hit's plain values (the timestamp arrives preformatted
+    by a vectorized strftime pass) so reruns reuse the formatted title,
+    metric and reasoning text instead of redoing the f-string work for
+    every expander.
+    """
+    result_icon = "✅" if correct else "❌"
+    signal_icon = "🔼" if signal == 'LONG' else "🔻"
+    return {
+        'title': (f"{result_icon} {when_str} - "
+                  f"{signal_icon} {signal} ({confidence}% conf) - "
+                  f"{price_change:+.2f}%"),
+        'table_md': ("| Entry | Result | Outcome |\n"
+                     "|:--|:--|:--|\n"
+                     f"| ${entry_price:.2f} | {price_change:+.2f}% | "
+                     f"{'CORRECT ✅' if correct else 'WRONG ❌'} |"),
+        'reasons_md': "\n".join(f"{j}. {reason}"
+                                for j, reason in enumerate(reasoning, 1)),
+    }
+
+@st.fragment
+def _render_signal_history(when, signal, confidence, entry, change, correct,
+                           reasoning):
+    """
+    Render the scanner's expander list inside its own fragment
+
+    Takes the scan hits as parallel columns (datetimes, signals,
+    confidences, entries, forward changes, correctness, reasoning lists)
+    rather than a list of dicts. Fragment scope means interactions that
+    originate in this block rerun only this function instead of the whole
+    script - the expander list is the widget-heaviest part of the page,
+    so isolating it keeps unrelated reruns from re-emitting all N
+    expanders.
+    """
+    st.markdown("### 📜 Signal History")
+
+    # One vectorized strftime pass instead of a Python call per title
+    when_str = when.strftime('%m/%d %I:%M %p')
+
+    # First paint mounts only the most recent page of expanders; the rest
+    # appear on request (widget count is the render cost here)
+    n = len(when)
+    show_all = st.session_state.get('show_all_signals', False)
+    n_shown = n if show_all else min(n, HISTORY_PAGE_SIZE)
+
+    # Display each signal, most recent first; the strings are prebuilt
+    # and cached so reruns only pay for the widgets
+    for k in range(n - 1, n - 1 - n_shown, -1):
+        view = _build_signal_view(
+            when_str[k], signal[k], int(confidence[k]),
+            float(change[k]), float(entry[k]),
+            bool(correct[k]), tuple(reasoning[k])
+        )
+
+        with st.expander(view['title'], expanded=False):
+            # One markdown table instead of three column containers with
+            # a metric widget each
+            st.markdown(view['table_md'])
+
+            st.markdown("**Why this signal:**")
+            st.markdown(view['reasons_md'])
+
+    if not show_all and n > HISTORY_PAGE_SIZE:
+        st.button(f"Show {n - HISTORY_PAGE_SIZE} older signals",
+                  on_click=lambda: st.session_state.update(show_all_signals=True))
+
+@st.cache_resource(max_entries=32)
+def _cached_candlestick_fig(ticker, timeframe_key, last_ts, n_bars,
+                            signal, confidence, _df, _indicators, _signal_info):
+    """
+    Build (or reuse) the candlestick figure for a given identity key
+
+    Figure construction allocates traces, shapes and annotations on every
+    rerun; the underscore args are excluded from the cache key, so the
+    figure is only rebuilt when the data/signal identity actually changes.
+    """
+    return create_candlestick_chart(_df, _indicators, _signal_info, ticker)
+
+# Static markup emitted on every rerun, named once here
+PAGE_CSS = """
     <style>
     .big-font {
         font-size: 30px !important;
@@ -55,7 +177,16 @@ st.markdown("""
         margin: 10px 0;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+FOOTER_HTML = """
+    <div style='text-align: center; color: #666;'>
+        <p>ICT Trading Signals | Data provided by Yahoo Finance (yfinance)</p>
+        <p><small>⚠️ This tool is for educational purposes only. Not financial advice.</small></p>
+    </div>
+"""
+
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
 # Title
 st.title("📈 ICT-Based Trading Signals")
@@ -89,6 +220,17 @@ timeframe_map = {
 
 period, interval, backtest_period, backtest_interval = timeframe_map[timeframe]
 
+# Longest window any tab needs at this interval: one HTTP round-trip per
+# rerun, each tab slices its own trailing view from the master frame.
+# yfinance caps 30m intraday history at 60 days.
+master_period_map = {
+    "Daily": "2y",
+    "4-Hour": "1y",
+    "1-Hour": "1y",
+    "30-Minute": "60d",
+}
+master_period = master_period_map[timeframe]
+
 # Info section
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 📊 ICT Strategies Included")
@@ -104,6 +246,10 @@ st.sidebar.markdown("""
 - ✅ Volume Imbalance
 """)
 
+# Single master fetch shared by every tab
+with st.spinner(f"Fetching data for {selected_ticker}..."):
+    master_df = fetch_stock_data(selected_ticker, period=master_period, interval=interval)
+
 # Main tabs
 tab1, tab2, tab3 = st.tabs(["🔴 Live Analysis", "⏰ Time Machine Backtest", "⭐ High Confidence Signals"])
 
@@ -111,61 +257,56 @@ tab1, tab2, tab3 = st.tabs(["🔴 Live Analysis", "⏰ Time Machine Backtest", "
 with tab1:
     st.header(f"Live Analysis - {selected_ticker}")
     
-    with st.spinner(f"Fetching data for {selected_ticker}..."):
-        df = fetch_stock_data(selected_ticker, period=period, interval=interval)
-        
+    with st.spinner(f"Preparing {selected_ticker} data..."):
+        df = _slice_period(master_df, period)
+
         # Resample to 4-hour if needed
         if timeframe == "4-Hour" and interval == "1h" and df is not None:
-            df = df.resample('4H').agg({
-                'open': 'first',
-                'high': 'max',
-                'low': 'min',
-                'close': 'last',
-                'volume': 'sum'
-            }).dropna()
+            df = resample_ohlcv(df, '4h')
         
         if df is not None and not df.empty:
+            # Raw close array for the scalar lookups below (skips a pandas
+            # indexer per rerun)
+            close_arr = df['close'].to_numpy()
+
+            # LTF-only first pass. The HTF bias only scales a score that is
+            # already directional, so when the cheap local signal stays
+            # NEUTRAL the HTF fetch cannot change the outcome - skip it.
+            signal_info = generate_signal(df)
+
             # Fetch higher timeframe data for multi-TF confirmation
             htf_df = None
-            try:
-                if timeframe == "30-Minute":
-                    # For 30min, use 4H as HTF
-                    htf_df = fetch_stock_data(selected_ticker, period="60d", interval="1h")
-                    if htf_df is not None and not htf_df.empty:
-                        htf_df = htf_df.resample('4H').agg({
-                            'open': 'first',
-                            'high': 'max',
-                            'low': 'min',
-                            'close': 'last',
-                            'volume': 'sum'
-                        }).dropna()
-                elif timeframe == "1-Hour":
-                    # For 1H, use Daily as HTF
-                    htf_df = fetch_stock_data(selected_ticker, period="1y", interval="1d")
-                elif timeframe == "4-Hour":
-                    # For 4H, use Daily as HTF
-                    htf_df = fetch_stock_data(selected_ticker, period="1y", interval="1d")
-                elif timeframe == "Daily":
-                    # For Daily, use Weekly as HTF (resample from daily)
-                    htf_df = fetch_stock_data(selected_ticker, period="2y", interval="1d")
-                    if htf_df is not None and not htf_df.empty:
-                        htf_df = htf_df.resample('W').agg({
-                            'open': 'first',
-                            'high': 'max',
-                            'low': 'min',
-                            'close': 'last',
-                            'volume': 'sum'
-                        }).dropna()
-            except Exception as e:
-                st.warning(f"Could not fetch HTF data: {e}")
-                htf_df = None
-            
-            # Generate signal with HTF confirmation
-            signal_info = generate_signal(df, htf_df=htf_df)
+            if signal_info['signal'] != 'NEUTRAL':
+                try:
+                    if timeframe == "30-Minute":
+                        # For 30min, use 4H as HTF
+                        htf_df = fetch_stock_data(selected_ticker, period="60d", interval="1h")
+                        if htf_df is not None and not htf_df.empty:
+                            htf_df = resample_ohlcv(htf_df, '4h')
+                    elif timeframe == "1-Hour":
+                        # For 1H, use Daily as HTF
+                        htf_df = fetch_stock_data(selected_ticker, period="1y", interval="1d")
+                    elif timeframe == "4-Hour":
+                        # For 4H, use Daily as HTF
+                        htf_df = fetch_stock_data(selected_ticker, period="1y", interval="1d")
+                    elif timeframe == "Daily":
+                        # For Daily, use Weekly as HTF - the 2y daily master
+                        # is exactly the frame we'd refetch, so resample it
+                        htf_df = resample_ohlcv(master_df, '1W')
+                except Exception as e:
+                    st.warning(f"Could not fetch HTF data: {e}")
+                    htf_df = None
+
+                # Re-score with HTF confirmation (the ICT indicators are
+                # fingerprint-cached, so only the confluence tally reruns)
+                if htf_df is not None and not htf_df.empty:
+                    signal_info = generate_signal(df, htf_df=htf_df)
             
             # Debug: Show HTF status
             if htf_df is not None and not htf_df.empty:
                 st.caption(f"✅ HTF data loaded: {len(htf_df)} candles")
+            elif signal_info['signal'] == 'NEUTRAL':
+                st.caption(f"💤 NEUTRAL signal - HTF fetch skipped (bias cannot change the outcome)")
             else:
                 st.caption(f"⚠️ HTF data not available - running without multi-timeframe confirmation")
             
@@ -194,7 +335,7 @@ with tab1:
                 st.markdown(f'<p class="big-font">${current_price:.2f}</p>', unsafe_allow_html=True)
                 
                 # Price change
-                price_change = ((current_price - df['close'].iloc[-2]) / df['close'].iloc[-2]) * 100
+                price_change = ((current_price - close_arr[-2]) / close_arr[-2]) * 100
                 change_color = "green" if price_change > 0 else "red"
                 st.markdown(f'<p style="color:{change_color}; font-size:18px;">{price_change:+.2f}%</p>', unsafe_allow_html=True)
             
@@ -206,16 +347,9 @@ with tab1:
             
             with metric_col1:
                 kill_zone = signal_info.get('kill_zone', 'OUTSIDE')
-                if kill_zone == 'NEW_YORK_AM':
-                    kz_display = "⭐ NY AM (BEST)"
-                    kz_color = "green"
-                elif kill_zone != 'OUTSIDE':
-                    kz_display = kill_zone.replace('_', ' ')
-                    kz_color = "orange"
-                else:
-                    kz_display = "❌ Outside Zones"
-                    kz_color = "gray"
-                
+                kz_display, kz_color = _KZ_DISPLAY.get(
+                    kill_zone, (kill_zone.replace('_', ' '), "orange"))
+
                 st.markdown(f"**Kill Zone**")
                 st.markdown(f'<p style="color:{kz_color}; font-size:18px; font-weight:bold;">{kz_display}</p>', unsafe_allow_html=True)
             
@@ -238,16 +372,8 @@ with tab1:
             with metric_col3:
                 p3_phase = signal_info.get('power_of_3', 'N/A')
                 
-                if p3_phase == 'DISTRIBUTION':
-                    p3_color = "green"
-                    p3_icon = "✅"
-                elif p3_phase == 'MANIPULATION':
-                    p3_color = "orange"
-                    p3_icon = "⚠️"
-                else:
-                    p3_color = "gray"
-                    p3_icon = "⏳"
-                
+                p3_color, p3_icon = _P3_DISPLAY.get(p3_phase, ("gray", "⏳"))
+
                 st.markdown(f"**Power of 3**")
                 st.markdown(f'<p style="color:{p3_color}; font-size:18px; font-weight:bold;">{p3_icon} {p3_phase}</p>', unsafe_allow_html=True)
             
@@ -256,16 +382,8 @@ with tab1:
                 htf_bias = htf_info.get('bias', 'N/A')
                 htf_strength = htf_info.get('strength', 0)
                 
-                if htf_bias == 'BULLISH':
-                    htf_color = "green"
-                    htf_icon = "📈"
-                elif htf_bias == 'BEARISH':
-                    htf_color = "red"
-                    htf_icon = "📉"
-                else:
-                    htf_color = "gray"
-                    htf_icon = "➖"
-                
+                htf_color, htf_icon = _HTF_DISPLAY.get(htf_bias, ("gray", "➖"))
+
                 st.markdown(f"**HTF Bias**")
                 st.markdown(f'<p style="color:{htf_color}; font-size:18px; font-weight:bold;">{htf_icon} {htf_bias}</p>', unsafe_allow_html=True)
                 if htf_bias != 'N/A':
@@ -276,8 +394,8 @@ with tab1:
             with st.expander("📋 Why this signal? (Click for detailed explanation)", expanded=True):
                 if signal_info['reasoning']:
                     detailed_reasons = explain_signal_in_detail(
-                        signal_info['reasoning'], 
-                        signal_info['signal'], 
+                        tuple(signal_info['reasoning']),
+                        signal_info['signal'],
                         signal_info['confidence']
                     )
                     for reason in detailed_reasons:
@@ -340,7 +458,11 @@ with tab1:
             st.markdown("### 📊 Price Chart with ICT Levels")
             
             indicators = signal_info['all_indicators']
-            fig = create_candlestick_chart(df, indicators, signal_info, selected_ticker)
+            fig = _cached_candlestick_fig(
+                selected_ticker, timeframe, int(df.index[-1].value), len(df),
+                signal_info['signal'], signal_info['confidence'],
+                df, indicators, signal_info
+            )
             st.plotly_chart(fig, use_container_width=True)
             
             # Score breakdown
@@ -366,23 +488,18 @@ with tab2:
     Simple: Choose a {timeframe.lower()} candle → See LONG/SHORT/NEUTRAL → Was it profitable in the next hour?
     """)
     
-    # Fetch full historical data
+    # Slice full historical data from the master fetch
     with st.spinner("Loading historical data..."):
-        full_df = fetch_stock_data(selected_ticker, period=backtest_period, interval=backtest_interval)
-        
+        full_df = _slice_period(master_df, backtest_period)
+
         # Resample if needed
         if timeframe == "4-Hour" and backtest_interval == "1h":
-            full_df = full_df.resample('4H').agg({
-                'open': 'first',
-                'high': 'max',
-                'low': 'min',
-                'close': 'last',
-                'volume': 'sum'
-            }).dropna()
+            full_df = resample_ohlcv(full_df, '4h')
     
     if full_df is not None and not full_df.empty:
         # Show available time range
-        st.caption(f"📅 Available data: {full_df.index[0].strftime('%Y-%m-%d %I:%M %p')} to {full_df.index[-1].strftime('%Y-%m-%d %I:%M %p')}")
+        data_span = full_df.index[[0, -1]].strftime('%Y-%m-%d %I:%M %p')
+        st.caption(f"📅 Available data: {data_span[0]} to {data_span[1]}")
         
         col1, col2, col3 = st.columns([2, 2, 1])
         
@@ -400,7 +517,9 @@ with tab2:
             available_times = full_df.index[date_mask]
             
             if len(available_times) > 0:
-                time_options = [t.strftime('%I:%M %p') for t in available_times]
+                # Vectorized strftime (C loop) instead of a per-timestamp
+                # Python loop while scrubbing the date picker
+                time_options = available_times.strftime('%I:%M %p').tolist()
                 selected_time_str = st.selectbox(
                     "⏰ Time",
                     options=time_options,
@@ -463,8 +582,8 @@ with tab2:
                     # Why did it give this signal? - Detailed explanation
                     with st.expander("📋 Why this signal? (Detailed explanation)", expanded=False):
                         detailed_reasons = explain_signal_in_detail(
-                            result['reasoning'], 
-                            result['signal'], 
+                            tuple(result['reasoning']),
+                            result['signal'],
                             result['confidence']
                         )
                         for reason in detailed_reasons:
@@ -475,17 +594,20 @@ with tab2:
                     st.markdown("### 📊 Chart at That Time")
                     
                     # Get data around that time
-                    target_idx = full_df.index.get_indexer([selected_datetime], method='nearest')[0]
+                    target_idx = nearest_position(full_df.index, selected_datetime)
                     chart_df = full_df.iloc[max(0, target_idx-100):min(len(full_df), target_idx+forward_periods+10)]
                     
-                    # Generate indicators for chart
-                    signal_info_hist = generate_signal(chart_df)
-                    
-                    fig_hist = create_candlestick_chart(
-                        chart_df, 
-                        signal_info_hist['all_indicators'],
-                        signal_info_hist,
-                        selected_ticker
+                    # Zone rectangles need positions relative to the chart
+                    # window (cheap on ~110 bars); the signal overlay reuses
+                    # the result computed at the test bar instead of
+                    # re-scoring a window that includes the forward candles
+                    chart_indicators = get_all_ict_indicators(chart_df)
+
+                    fig_hist = _cached_candlestick_fig(
+                        selected_ticker, timeframe,
+                        int(chart_df.index[-1].value), len(chart_df),
+                        result['signal'], result['confidence'],
+                        chart_df, chart_indicators, result['signal_info']
                     )
                     st.plotly_chart(fig_hist, use_container_width=True)
                 else:
@@ -524,36 +646,82 @@ with tab2:
             
             if st.button("Run Range Backtest", type="primary"):
                 with st.spinner("Running backtest on date range..."):
-                    # Generate test dates - sample evenly across the range
-                    total_points = len(full_df.loc[start_date:end_date])
-                    test_indices = range(0, total_points, test_frequency)
-                    test_dates = [full_df.loc[start_date:end_date].index[i] for i in test_indices if i < total_points]
-                    
-                    results = []
+                    # Integer positions of the selected window inside
+                    # full_df: one label binary search, no frame slice.
+                    # String bounds keep the inclusive whole-day semantics
+                    # (and work on tz-aware indexes, unlike raw date objects)
+                    start_pos, end_pos = full_df.index.slice_locs(str(start_date), str(end_date))
+                    test_positions = np.arange(start_pos, end_pos, test_frequency)
+
+                    # Signals and close arrays once for the whole range;
+                    # each test is then a few array lookups
+                    sig_arr, conf_arr, reasons = generate_signals_vectorized(full_df)
+                    entry_close = full_df['close'].to_numpy()
+                    future_close = full_df['close'].shift(-forward_periods_range).to_numpy()
+                    min_required = min(50, len(full_df) // 3)
+
+                    # Accumulate straight into preallocated column arrays
+                    # (typed columns, no list-of-dicts -> DataFrame inference)
+                    n_tests = len(test_positions)
+                    res_date = np.empty(n_tests, dtype='datetime64[ns]')
+                    res_signal = np.empty(n_tests, dtype=object)
+                    res_conf = np.empty(n_tests, dtype=np.int64)
+                    res_entry = np.empty(n_tests, dtype=np.float64)
+                    res_pct = np.empty(n_tests, dtype=np.float64)
+                    res_correct = np.zeros(n_tests, dtype=bool)
+                    # Drop the timezone but keep wall-clock times so the
+                    # stored datetime64 dates match the exchange calendar
+                    if full_df.index.tz is not None:
+                        index_values = full_df.index.tz_localize(None).to_numpy()
+                    else:
+                        index_values = full_df.index.to_numpy()
+
+                    n_results = 0
                     progress_bar = st.progress(0)
-                    
-                    for i, test_date in enumerate(test_dates):
-                        result = backtest_signal(full_df, test_date, forward_periods_range)
-                        if result:
-                            results.append(result)
-                        progress_bar.progress((i + 1) / len(test_dates))
-                    
+
+                    for i, pos in enumerate(test_positions):
+                        if pos >= min_required:
+                            result = backtest_signal_at_position(
+                                full_df, pos, forward_periods_range,
+                                entry_close, future_close,
+                                sig_arr, conf_arr, reasons
+                            )
+                            if result:
+                                res_date[n_results] = index_values[pos]
+                                res_signal[n_results] = result['signal']
+                                res_conf[n_results] = result['confidence']
+                                res_entry[n_results] = result['entry_price']
+                                res_pct[n_results] = result['price_change_pct']
+                                res_correct[n_results] = result['correct']
+                                n_results += 1
+                        progress_bar.progress((i + 1) / n_tests)
+
                     progress_bar.empty()
-                    
-                    if results:
-                        # Calculate metrics
-                        total_signals = len(results)
-                        correct_signals = sum(r['correct'] for r in results)
+
+                    # Trim to the filled prefix
+                    res_date = res_date[:n_results]
+                    res_signal = res_signal[:n_results]
+                    res_conf = res_conf[:n_results]
+                    res_entry = res_entry[:n_results]
+                    res_pct = res_pct[:n_results]
+                    res_correct = res_correct[:n_results]
+
+                    if n_results > 0:
+                        # Calculate metrics straight off the arrays
+                        total_signals = n_results
+                        correct_signals = int(res_correct.sum())
                         accuracy = (correct_signals / total_signals) * 100
-                        
-                        avg_return = sum(r['price_change_pct'] for r in results) / total_signals
-                        
+
+                        avg_return = float(res_pct.mean())
+
                         # Filter by signal type
-                        long_signals = [r for r in results if r['signal'] == 'LONG']
-                        short_signals = [r for r in results if r['signal'] == 'SHORT']
-                        
-                        long_accuracy = (sum(r['correct'] for r in long_signals) / len(long_signals) * 100) if long_signals else 0
-                        short_accuracy = (sum(r['correct'] for r in short_signals) / len(short_signals) * 100) if short_signals else 0
+                        long_mask = res_signal == 'LONG'
+                        short_mask = res_signal == 'SHORT'
+                        n_long = int(long_mask.sum())
+                        n_short = int(short_mask.sum())
+
+                        long_accuracy = (res_correct[long_mask].mean() * 100) if n_long else 0
+                        short_accuracy = (res_correct[short_mask].mean() * 100) if n_short else 0
                         
                         # Display summary metrics
                         st.markdown("---")
@@ -578,54 +746,59 @@ with tab2:
                         acc_col1, acc_col2, acc_col3 = st.columns(3)
                         
                         with acc_col1:
-                            st.metric("LONG Signals", len(long_signals))
+                            st.metric("LONG Signals", n_long)
                             st.metric("LONG Accuracy", f"{long_accuracy:.1f}%")
-                        
+
                         with acc_col2:
-                            st.metric("SHORT Signals", len(short_signals))
+                            st.metric("SHORT Signals", n_short)
                             st.metric("SHORT Accuracy", f"{short_accuracy:.1f}%")
-                        
+
                         with acc_col3:
-                            neutral_count = total_signals - len(long_signals) - len(short_signals)
+                            neutral_count = total_signals - n_long - n_short
                             st.metric("NEUTRAL Signals", neutral_count)
                         
                         # Performance chart
                         st.markdown("---")
                         st.markdown("### 📈 Performance Over Time")
                         
-                        fig_backtest = create_backtest_chart(full_df, results)
+                        fig_backtest = create_backtest_chart(full_df, {
+                            'date': res_date,
+                            'signal': res_signal,
+                            'confidence': res_conf,
+                            'price_change_pct': res_pct,
+                            'correct': res_correct
+                        })
                         if fig_backtest:
                             st.plotly_chart(fig_backtest, use_container_width=True)
-                        
+
                         # Detailed results table
                         st.markdown("---")
                         st.markdown("### 📋 Detailed Results")
+
+                        display_df = pd.DataFrame({
+                            'Date': pd.DatetimeIndex(res_date).date,
+                            'Signal': res_signal,
+                            'Confidence (%)': res_conf,
+                            'Entry Price ($)': res_entry,
+                            'Return (%)': res_pct,
+                            'Correct': np.where(res_correct, '✅', '❌')
+                        })
                         
-                        results_df = pd.DataFrame(results)
-                        results_df['date'] = pd.to_datetime(results_df['date']).dt.date
-                        
-                        display_df = results_df[[
-                            'date', 'signal', 'confidence', 'entry_price', 
-                            'price_change_pct', 'correct'
-                        ]].copy()
-                        
-                        display_df.columns = [
-                            'Date', 'Signal', 'Confidence (%)', 'Entry Price ($)',
-                            'Return (%)', 'Correct'
-                        ]
-                        
-                        display_df['Correct'] = display_df['Correct'].map({True: '✅', False: '❌'})
-                        
-                        st.dataframe(
-                            display_df.style.background_gradient(
-                                subset=['Return (%)'],
-                                cmap='RdYlGn',
-                                vmin=-5,
-                                vmax=5
-                            ),
-                            use_container_width=True,
-                            height=400
-                        )
+                        # Styler CPU and payload grow with row count; past a
+                        # few hundred rows ship the plain frame instead
+                        if len(display_df) > 200:
+                            st.dataframe(display_df, use_container_width=True, height=400)
+                        else:
+                            st.dataframe(
+                                display_df.style.background_gradient(
+                                    subset=['Return (%)'],
+                                    cmap='RdYlGn',
+                                    vmin=-5,
+                                    vmax=5
+                                ),
+                                use_container_width=True,
+                                height=400
+                            )
                     else:
                         st.warning("No valid backtest results for the selected range.")
     else:
@@ -641,149 +814,102 @@ with tab3:
     These are the strongest setups identified by the system - the ones where multiple ICT strategies aligned perfectly.
     """)
     
-    with st.spinner(f"Scanning last 365 days for high confidence signals..."):
-        # Fetch data for signal scanning (1 year)
-        scan_df = fetch_stock_data(selected_ticker, period="1y", interval=interval)
-        
-        # Resample if needed
-        if timeframe == "4-Hour" and interval == "1h" and scan_df is not None:
-            scan_df = scan_df.resample('4H').agg({
-                'open': 'first',
-                'high': 'max',
-                'low': 'min',
-                'close': 'last',
-                'volume': 'sum'
-            }).dropna()
+    # The 365-day scan is expensive; only run it once the user asks,
+    # then keep showing results across reruns
+    st.session_state.setdefault('ran_tab3', False)
+
+    if st.button("🔍 Scan now", type="primary") or st.session_state.ran_tab3:
+        st.session_state.ran_tab3 = True
+
+        with st.spinner(f"Scanning last 365 days for high confidence signals..."):
+            # Scan window (1 year, or the full 60d master for 30-minute
+            # bars, which is all the intraday history yfinance serves)
+            scan_df = _slice_period(master_df, "1y")
+
+            # Resample if needed
+            if timeframe == "4-Hour" and interval == "1h" and scan_df is not None:
+                scan_df = resample_ohlcv(scan_df, '4h')
     
-    if scan_df is not None and not scan_df.empty:
-        # Fetch HTF data for multi-timeframe confirmation
-        htf_scan_df = None
-        try:
-            if timeframe == "30-Minute":
-                htf_scan_df = fetch_stock_data(selected_ticker, period="60d", interval="1h")
-                if htf_scan_df is not None and not htf_scan_df.empty:
-                    htf_scan_df = htf_scan_df.resample('4H').agg({
-                        'open': 'first',
-                        'high': 'max',
-                        'low': 'min',
-                        'close': 'last',
-                        'volume': 'sum'
-                    }).dropna()
-            elif timeframe == "1-Hour":
-                htf_scan_df = fetch_stock_data(selected_ticker, period="1y", interval="1d")
-            elif timeframe == "4-Hour":
-                htf_scan_df = fetch_stock_data(selected_ticker, period="1y", interval="1d")
-            elif timeframe == "Daily":
-                htf_scan_df = fetch_stock_data(selected_ticker, period="2y", interval="1d")
-                if htf_scan_df is not None and not htf_scan_df.empty:
-                    htf_scan_df = htf_scan_df.resample('W').agg({
-                        'open': 'first',
-                        'high': 'max',
-                        'low': 'min',
-                        'close': 'last',
-                        'volume': 'sum'
-                    }).dropna()
-        except Exception as e:
-            st.caption(f"⚠️ Could not fetch HTF data: {e}")
+        if scan_df is not None and not scan_df.empty:
+            # Fetch HTF data for multi-timeframe confirmation
             htf_scan_df = None
+            try:
+                if timeframe == "30-Minute":
+                    htf_scan_df = fetch_stock_data(selected_ticker, period="60d", interval="1h")
+                    if htf_scan_df is not None and not htf_scan_df.empty:
+                        htf_scan_df = resample_ohlcv(htf_scan_df, '4h')
+                elif timeframe == "1-Hour":
+                    htf_scan_df = fetch_stock_data(selected_ticker, period="1y", interval="1d")
+                elif timeframe == "4-Hour":
+                    htf_scan_df = fetch_stock_data(selected_ticker, period="1y", interval="1d")
+                elif timeframe == "Daily":
+                    htf_scan_df = resample_ohlcv(master_df, '1W')
+            except Exception as e:
+                st.caption(f"⚠️ Could not fetch HTF data: {e}")
+                htf_scan_df = None
         
-        # Scan through each candle for high confidence signals
-        high_conf_signals = []
-        
-        min_required = min(50, len(scan_df) // 3)
-        
-        for idx in range(min_required, len(scan_df)):
-            # Generate signal for this point in time (with HTF data)
-            historical_slice = scan_df.iloc[:idx+1].copy()
-            signal_result = generate_signal(historical_slice, htf_df=htf_scan_df)
-            
-            # Only keep if confidence >= 70%
-            if signal_result['confidence'] >= 70 and signal_result['signal'] != 'NEUTRAL':
-                # Calculate what happened after
-                forward_check = 2 if timeframe == "30-Minute" else 1
-                if idx + forward_check < len(scan_df):
-                    entry_price = scan_df['close'].iloc[idx]
-                    future_price = scan_df['close'].iloc[idx + forward_check]
-                    price_change = ((future_price - entry_price) / entry_price) * 100
-                    
-                    # Was it correct?
-                    was_correct = False
-                    if signal_result['signal'] == 'LONG' and price_change > 0.05:
-                        was_correct = True
-                    elif signal_result['signal'] == 'SHORT' and price_change < -0.05:
-                        was_correct = True
-                    
-                    high_conf_signals.append({
-                        'datetime': scan_df.index[idx],
-                        'signal': signal_result['signal'],
-                        'confidence': signal_result['confidence'],
-                        'entry_price': entry_price,
-                        'price_change': price_change,
-                        'correct': was_correct,
-                        'reasoning': signal_result['reasoning']
-                    })
-        
-        if high_conf_signals:
-            st.success(f"🎯 Found {len(high_conf_signals)} high-confidence (70%+) signals in the last 365 days!")
-            
-            # Summary stats
-            correct_count = sum(1 for s in high_conf_signals if s['correct'])
-            accuracy = (correct_count / len(high_conf_signals)) * 100 if high_conf_signals else 0
-            
-            stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
-            
-            with stat_col1:
-                st.metric("Total Signals", len(high_conf_signals))
-            
-            with stat_col2:
-                st.metric("Correct", f"{correct_count}/{len(high_conf_signals)}")
-            
-            with stat_col3:
-                st.metric("Accuracy", f"{accuracy:.1f}%")
-            
-            with stat_col4:
-                avg_conf = sum(s['confidence'] for s in high_conf_signals) / len(high_conf_signals)
-                st.metric("Avg Confidence", f"{avg_conf:.0f}%")
-            
-            st.markdown("---")
-            st.markdown("### 📜 Signal History")
-            
-            # Display each signal
-            for i, sig in enumerate(reversed(high_conf_signals), 1):  # Most recent first
-                result_icon = "✅" if sig['correct'] else "❌"
-                signal_icon = "🔼" if sig['signal'] == 'LONG' else "🔻"
-                
-                with st.expander(
-                    f"{result_icon} {sig['datetime'].strftime('%m/%d %I:%M %p')} - "
-                    f"{signal_icon} {sig['signal']} ({sig['confidence']}% conf) - "
-                    f"{sig['price_change']:+.2f}%",
-                    expanded=False
-                ):
-                    res_col1, res_col2, res_col3 = st.columns(3)
-                    
-                    with res_col1:
-                        st.metric("Entry", f"${sig['entry_price']:.2f}")
-                    
-                    with res_col2:
-                        st.metric("Result", f"{sig['price_change']:+.2f}%")
-                    
-                    with res_col3:
-                        outcome = "CORRECT ✅" if sig['correct'] else "WRONG ❌"
-                        st.metric("Outcome", outcome)
-                    
-                    st.markdown("**Why this signal:**")
-                    for j, reason in enumerate(sig['reasoning'], 1):
-                        st.markdown(f"{j}. {reason}")
+            # Scan every candle in one batched pass (indicators computed once
+            # instead of per growing slice)
+            min_required = min(50, len(scan_df) // 3)
+            forward_check = 2 if timeframe == "30-Minute" else 1
+
+            sig_arr, conf_arr, reasons = generate_signals_vectorized(scan_df, htf_df=htf_scan_df)
+            close_arr = scan_df['close'].to_numpy()
+            future_close = scan_df['close'].shift(-forward_check).to_numpy()
+
+            # Only keep 70%+ confidence bars that have a forward bar to grade
+            mask = (conf_arr >= 70) & (sig_arr != 'NEUTRAL')
+            mask[:min_required] = False
+            mask[len(scan_df) - forward_check:] = False
+
+            # Grade every hit in one vectorized pass
+            hit_idx = np.flatnonzero(mask)
+            hit_entry = close_arr[hit_idx]
+            hit_change = ((future_close[hit_idx] - hit_entry) / hit_entry) * 100
+            hit_correct = np.where(sig_arr[hit_idx] == 'LONG',
+                                   hit_change > 0.05, hit_change < -0.05)
+
+            # Keep the hits as parallel columns (SoA) - the history renderer
+            # and summary work off contiguous arrays, no per-row dicts
+            n_hits = len(hit_idx)
+            hit_when = scan_df.index[hit_idx]
+            hit_signal = sig_arr[hit_idx]
+            hit_conf = conf_arr[hit_idx]
+            hit_reasons = [reasons[idx] for idx in hit_idx]
+
+            if n_hits:
+                st.success(f"🎯 Found {n_hits} high-confidence (70%+) signals in the last 365 days!")
+
+                # Summary stats straight off the graded arrays
+                correct_count = int(hit_correct.sum())
+                accuracy = (correct_count / n_hits) * 100
+
+                stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
+
+                with stat_col1:
+                    st.metric("Total Signals", n_hits)
+
+                with stat_col2:
+                    st.metric("Correct", f"{correct_count}/{n_hits}")
+
+                with stat_col3:
+                    st.metric("Accuracy", f"{accuracy:.1f}%")
+
+                with stat_col4:
+                    avg_conf = float(hit_conf.mean())
+                    st.metric("Avg Confidence", f"{avg_conf:.0f}%")
+
+                st.markdown("---")
+                _render_signal_history(hit_when, hit_signal, hit_conf,
+                                       hit_entry, hit_change, hit_correct,
+                                       hit_reasons)
+            else:
+                st.info("🔍 No 70%+ confidence signals found in the last 365 days. This means there haven't been many high-probability setups recently.")
         else:
-            st.info("🔍 No 70%+ confidence signals found in the last 365 days. This means there haven't been many high-probability setups recently.")
+            st.error("Unable to load data for signal scanning.")
     else:
-        st.error("Unable to load data for signal scanning.")
+        st.info("Click **Scan now** to scan the last 365 days for high-confidence signals.")
 
 # Footer
 st.markdown("---")
-st.markdown("""
-    <div style='text-align: center; color: #666;'>
-        <p>ICT Trading Signals | Data provided by Yahoo Finance (yfinance)</p>
-        <p><small>⚠️ This tool is for educational purposes only. Not financial advice.</small></p>
-    </div>
-""", unsafe_allow_html=True)
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
@@ -1,177 +1,186 @@
 """
 Detailed signal explanations for ICT trading strategies
 """
+import functools
+import re
 
+# OTE reasons are recognized by any of four literal tokens; one compiled
+# alternation scans the string once instead of four separate 'in' checks
+_OTE_RE = re.compile(r"OTE|0\.62|0\.705|0\.79")
+
+# Explanation templates, one per reason category, built once at import.
+# Each entry is a (bullish, bearish) pair; single-direction categories
+# store the same template twice so lookup stays uniform.
+_OB_BULL = ("🟩 **BIG BUYERS stepped in here before**\n"
+            "   • {reason}\n"
+            "   • Think of this like a 'support zone' where smart money bought heavily\n"
+            "   • When price comes back here, those big buyers often return\n"
+            "   • Strong institutional buying pressure = price likely to bounce UP")
+_OB_BEAR = ("🟥 **BIG SELLERS stepped in here before**\n"
+            "   • {reason}\n"
+            "   • This is a 'resistance zone' where institutions sold aggressively\n"
+            "   • Price returning here often triggers more selling\n"
+            "   • Strong institutional selling pressure = price likely to drop DOWN")
+_FVG_BULL = ("⬆️ **PRICE GAP needs to be filled (bullish)**\n"
+             "   • {reason}\n"
+             "   • Price jumped up so fast it left a 'gap' - unfair pricing\n"
+             "   • Markets love 'fair value' - gaps usually get filled\n"
+             "   • This gap acts like a magnet pulling price UP to fill it")
+_FVG_BEAR = ("⬇️ **PRICE GAP needs to be filled (bearish)**\n"
+             "   • {reason}\n"
+             "   • Price dropped so fast it left a 'gap' - unfair pricing\n"
+             "   • Markets seek balance - these gaps tend to get filled\n"
+             "   • This gap acts like a magnet pulling price DOWN")
+_SWEEP_BULL = ("💧 **LIQUIDITY GRAB happened (bullish reversal)**\n"
+               "   • {reason}\n"
+               "   • Smart money 'faked out' traders by briefly dropping price\n"
+               "   • This triggered stop losses (grabbed liquidity)\n"
+               "   • Now they reverse and push price UP - classic trap for amateurs")
+_SWEEP_BEAR = ("💧 **LIQUIDITY GRAB happened (bearish reversal)**\n"
+               "   • {reason}\n"
+               "   • Smart money 'faked out' traders by briefly spiking price\n"
+               "   • This triggered buy stops (grabbed liquidity)\n"
+               "   • Now they reverse and push price DOWN - trap set and sprung")
+_STRUCT_BULL = ("📊 **TREND CHANGED to BULLISH**\n"
+                "   • {reason}\n"
+                "   • Price broke above previous resistance - major shift\n"
+                "   • Higher highs and higher lows forming\n"
+                "   • The 'structure' of the chart now favors buyers")
+_STRUCT_BEAR = ("📊 **TREND CHANGED to BEARISH**\n"
+                "   • {reason}\n"
+                "   • Price broke below previous support - major shift\n"
+                "   • Lower highs and lower lows forming\n"
+                "   • The 'structure' of the chart now favors sellers")
+_DISP_BULL = ("🚀 **EXPLOSIVE MOVE UP (displacement)**\n"
+              "   • {reason}\n"
+              "   • Price moved up EXTREMELY fast with strong momentum\n"
+              "   • Shows institutions are aggressively buying\n"
+              "   • This kind of power move usually continues in the same direction")
+_DISP_BEAR = ("💥 **EXPLOSIVE MOVE DOWN (displacement)**\n"
+              "   • {reason}\n"
+              "   • Price moved down EXTREMELY fast with strong momentum\n"
+              "   • Shows institutions are aggressively selling\n"
+              "   • This kind of power move usually continues in the same direction")
+_OTE = ("🎯 **PERFECT ENTRY ZONE (Fibonacci sweet spot)**\n"
+        "   • {reason}\n"
+        "   • Price is at a 'golden ratio' level (62-79% retracement)\n"
+        "   • This is where smart money often enters trades\n"
+        "   • Optimal Trade Entry = highest probability price level")
+_BREAKER_BULL = ("🔄 **FAILED RESISTANCE became SUPPORT**\n"
+                 "   • {reason}\n"
+                 "   • What was once resistance got broken and flipped\n"
+                 "   • Now acts as support - role reversal\n"
+                 "   • Very powerful signal when this happens")
+_BREAKER_BEAR = ("🔄 **FAILED SUPPORT became RESISTANCE**\n"
+                 "   • {reason}\n"
+                 "   • What was once support got broken and flipped\n"
+                 "   • Now acts as resistance - role reversal\n"
+                 "   • Very powerful signal when this happens")
+_VOLUME = ("📊 **UNUSUAL VOLUME PATTERN detected**\n"
+           "   • {reason}\n"
+           "   • Trading volume shows clear imbalance between buyers/sellers\n"
+           "   • When volume is lopsided, price often continues that direction\n"
+           "   • This confirms the move is real, not just noise")
+_PREMIUM = ("💰 **PRICE IN EXPENSIVE ZONE (premium)**\n"
+            "   • {reason}\n"
+            "   • Price is in the upper range - considered 'expensive'\n"
+            "   • Good for selling, not ideal for buying\n"
+            "   • Smart money often distributes (sells) in premium zones")
+_DISCOUNT = ("💵 **PRICE IN CHEAP ZONE (discount)**\n"
+             "   • {reason}\n"
+             "   • Price is in the lower range - considered 'cheap'\n"
+             "   • Good for buying, not ideal for selling\n"
+             "   • Smart money often accumulates (buys) in discount zones")
+_OTHER = ("📌 {reason}\n"
+          "   • Additional confluence supporting this signal")
+
+_TEMPLATES = {
+    'order_block': (_OB_BULL, _OB_BEAR),
+    'fvg': (_FVG_BULL, _FVG_BEAR),
+    'liquidity_sweep': (_SWEEP_BULL, _SWEEP_BEAR),
+    'structure': (_STRUCT_BULL, _STRUCT_BEAR),
+    'displacement': (_DISP_BULL, _DISP_BEAR),
+    'ote': (_OTE, _OTE),
+    'breaker': (_BREAKER_BULL, _BREAKER_BEAR),
+    'volume_imbalance': (_VOLUME, _VOLUME),
+    'premium': (_PREMIUM, _PREMIUM),
+    'discount': (_DISCOUNT, _DISCOUNT),
+    'other': (_OTHER, _OTHER),
+}
+
+def _classify(reason):
+    """
+    Map one technical reason to its (category, is_bullish) template key
+
+    Lowercases the string once and checks each category in the same order
+    the old if/elif cascade did, so classification is unchanged.
+    """
+    reason_lower = reason.lower()
+    if "Order Block" in reason:
+        return 'order_block', "Bullish" in reason
+    if "FVG" in reason:
+        return 'fvg', "Bullish" in reason
+    if "liquidity sweep" in reason_lower:
+        return 'liquidity_sweep', "bullish" in reason_lower
+    if "market structure" in reason_lower or "Break of Structure" in reason:
+        return 'structure', "Bullish" in reason
+    if "displacement" in reason_lower:
+        return 'displacement', "bullish" in reason_lower
+    if _OTE_RE.search(reason):
+        return 'ote', True
+    if "Breaker" in reason:
+        return 'breaker', "Bullish" in reason
+    if "Volume Imbalance" in reason or "volume imbalance" in reason_lower:
+        return 'volume_imbalance', True
+    if "Premium" in reason:
+        return 'premium', True
+    if "Discount" in reason:
+        return 'discount', True
+    return 'other', True
+
+@functools.lru_cache(maxsize=512)
 def explain_signal_in_detail(reasoning_list, signal_type, confidence):
     """
     Convert technical signal reasoning into detailed, beginner-friendly explanations
-    
+
+    Memoized on the (reasoning, signal, confidence) key so reruns that
+    re-display the same signal reuse the built text; callers pass the
+    reasoning as a tuple to keep the key hashable. Each reason is
+    classified once and filled into a module-level template instead of
+    walking a chain of substring checks per branch.
+
     Args:
-        reasoning_list: List of technical reasons from signal generator
+        reasoning_list: Tuple of technical reasons from signal generator
         signal_type: LONG, SHORT, or NEUTRAL
         confidence: Confidence percentage
-        
+
     Returns:
         List of detailed, easy-to-understand explanations
     """
-    detailed_explanations = []
-    
-    # Add opening context
+    # Opening context
     if signal_type == "LONG":
-        detailed_explanations.append(f"📈 **{confidence}% confident this is a good time to BUY (go LONG)**")
-        detailed_explanations.append("")
-        detailed_explanations.append("**Here's why in simple terms:**")
+        prefix = [f"📈 **{confidence}% confident this is a good time to BUY (go LONG)**",
+                  "", "**Here's why in simple terms:**", ""]
     elif signal_type == "SHORT":
-        detailed_explanations.append(f"📉 **{confidence}% confident this is a good time to SELL (go SHORT)**")
-        detailed_explanations.append("")
-        detailed_explanations.append("**Here's why in simple terms:**")
+        prefix = [f"📉 **{confidence}% confident this is a good time to SELL (go SHORT)**",
+                  "", "**Here's why in simple terms:**", ""]
     else:
-        detailed_explanations.append(f"😐 **No clear signal right now ({confidence}% confidence)**")
-        detailed_explanations.append("")
-        detailed_explanations.append("**Why we're waiting:**")
-    
-    detailed_explanations.append("")
-    
-    # Translate each technical reason
+        prefix = [f"😐 **No clear signal right now ({confidence}% confidence)**",
+                  "", "**Why we're waiting:**", ""]
+
+    # Translate each technical reason through the template table
+    body = []
     for i, reason in enumerate(reasoning_list, 1):
-        explanation = f"**{i}.** "
-        
-        # Order Blocks
-        if "Order Block" in reason:
-            if "Bullish" in reason:
-                explanation += "🟩 **BIG BUYERS stepped in here before**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • Think of this like a 'support zone' where smart money bought heavily\n"
-                explanation += "   • When price comes back here, those big buyers often return\n"
-                explanation += "   • Strong institutional buying pressure = price likely to bounce UP"
-            else:  # Bearish
-                explanation += "🟥 **BIG SELLERS stepped in here before**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • This is a 'resistance zone' where institutions sold aggressively\n"
-                explanation += "   • Price returning here often triggers more selling\n"
-                explanation += "   • Strong institutional selling pressure = price likely to drop DOWN"
-        
-        # Fair Value Gaps (FVG)
-        elif "FVG" in reason:
-            if "Bullish" in reason:
-                explanation += "⬆️ **PRICE GAP needs to be filled (bullish)**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • Price jumped up so fast it left a 'gap' - unfair pricing\n"
-                explanation += "   • Markets love 'fair value' - gaps usually get filled\n"
-                explanation += "   • This gap acts like a magnet pulling price UP to fill it"
-            else:  # Bearish
-                explanation += "⬇️ **PRICE GAP needs to be filled (bearish)**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • Price dropped so fast it left a 'gap' - unfair pricing\n"
-                explanation += "   • Markets seek balance - these gaps tend to get filled\n"
-                explanation += "   • This gap acts like a magnet pulling price DOWN"
-        
-        # Liquidity Sweeps
-        elif "liquidity sweep" in reason.lower():
-            if "bullish" in reason.lower():
-                explanation += "💧 **LIQUIDITY GRAB happened (bullish reversal)**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • Smart money 'faked out' traders by briefly dropping price\n"
-                explanation += "   • This triggered stop losses (grabbed liquidity)\n"
-                explanation += "   • Now they reverse and push price UP - classic trap for amateurs"
-            else:  # Bearish
-                explanation += "💧 **LIQUIDITY GRAB happened (bearish reversal)**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • Smart money 'faked out' traders by briefly spiking price\n"
-                explanation += "   • This triggered buy stops (grabbed liquidity)\n"
-                explanation += "   • Now they reverse and push price DOWN - trap set and sprung"
-        
-        # Market Structure
-        elif "market structure" in reason.lower() or "Break of Structure" in reason:
-            if "Bullish" in reason:
-                explanation += "📊 **TREND CHANGED to BULLISH**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • Price broke above previous resistance - major shift\n"
-                explanation += "   • Higher highs and higher lows forming\n"
-                explanation += "   • The 'structure' of the chart now favors buyers"
-            else:  # Bearish
-                explanation += "📊 **TREND CHANGED to BEARISH**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • Price broke below previous support - major shift\n"
-                explanation += "   • Lower highs and lower lows forming\n"
-                explanation += "   • The 'structure' of the chart now favors sellers"
-        
-        # Displacement
-        elif "displacement" in reason.lower():
-            if "bullish" in reason.lower():
-                explanation += "🚀 **EXPLOSIVE MOVE UP (displacement)**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • Price moved up EXTREMELY fast with strong momentum\n"
-                explanation += "   • Shows institutions are aggressively buying\n"
-                explanation += "   • This kind of power move usually continues in the same direction"
-            else:  # Bearish
-                explanation += "💥 **EXPLOSIVE MOVE DOWN (displacement)**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • Price moved down EXTREMELY fast with strong momentum\n"
-                explanation += "   • Shows institutions are aggressively selling\n"
-                explanation += "   • This kind of power move usually continues in the same direction"
-        
-        # OTE (Optimal Trade Entry)
-        elif "OTE" in reason or "0.62" in reason or "0.705" in reason or "0.79" in reason:
-            explanation += "🎯 **PERFECT ENTRY ZONE (Fibonacci sweet spot)**\n"
-            explanation += f"   • {reason}\n"
-            explanation += "   • Price is at a 'golden ratio' level (62-79% retracement)\n"
-            explanation += "   • This is where smart money often enters trades\n"
-            explanation += "   • Optimal Trade Entry = highest probability price level"
-        
-        # Breaker Blocks
-        elif "Breaker" in reason:
-            if "Bullish" in reason:
-                explanation += "🔄 **FAILED RESISTANCE became SUPPORT**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • What was once resistance got broken and flipped\n"
-                explanation += "   • Now acts as support - role reversal\n"
-                explanation += "   • Very powerful signal when this happens"
-            else:  # Bearish
-                explanation += "🔄 **FAILED SUPPORT became RESISTANCE**\n"
-                explanation += f"   • {reason}\n"
-                explanation += "   • What was once support got broken and flipped\n"
-                explanation += "   • Now acts as resistance - role reversal\n"
-                explanation += "   • Very powerful signal when this happens"
-        
-        # Volume Imbalance
-        elif "Volume Imbalance" in reason or "volume imbalance" in reason.lower():
-            explanation += "📊 **UNUSUAL VOLUME PATTERN detected**\n"
-            explanation += f"   • {reason}\n"
-            explanation += "   • Trading volume shows clear imbalance between buyers/sellers\n"
-            explanation += "   • When volume is lopsided, price often continues that direction\n"
-            explanation += "   • This confirms the move is real, not just noise"
-        
-        # Premium/Discount
-        elif "Premium" in reason:
-            explanation += "💰 **PRICE IN EXPENSIVE ZONE (premium)**\n"
-            explanation += f"   • {reason}\n"
-            explanation += "   • Price is in the upper range - considered 'expensive'\n"
-            explanation += "   • Good for selling, not ideal for buying\n"
-            explanation += "   • Smart money often distributes (sells) in premium zones"
-        elif "Discount" in reason:
-            explanation += "💵 **PRICE IN CHEAP ZONE (discount)**\n"
-            explanation += f"   • {reason}\n"
-            explanation += "   • Price is in the lower range - considered 'cheap'\n"
-            explanation += "   • Good for buying, not ideal for selling\n"
-            explanation += "   • Smart money often accumulates (buys) in discount zones"
-        
-        # Generic fallback for any other reasons
-        else:
-            explanation += f"📌 {reason}\n"
-            explanation += "   • Additional confluence supporting this signal"
-        
-        detailed_explanations.append(explanation)
-    
-    # Add closing summary
-    detailed_explanations.append("")
-    detailed_explanations.append("---")
-    detailed_explanations.append("")
-    
+        category, is_bullish = _classify(reason)
+        pair = _TEMPLATES[category]
+        template = pair[0] if is_bullish else pair[1]
+        body.append(f"**{i}.** " + template.format(reason=reason))
+
+    # Closing summary
     if signal_type in ["LONG", "SHORT"]:
-        detailed_explanations.append(f"**💡 Bottom Line:** All these factors together give us **{confidence}% confidence** " +
-                                    f"that price will move **{'UP ⬆️' if signal_type == 'LONG' else 'DOWN ⬇️'}** soon.")
+        bottom_line = (f"**💡 Bottom Line:** All these factors together give us **{confidence}% confidence** " +
+                       f"that price will move **{'UP ⬆️' if signal_type == 'LONG' else 'DOWN ⬇️'}** soon.")
     else:
-        detailed_explanations.append(f"**💡 Bottom Line:** Not enough clear signals right now. Better to wait for a clearer setup.")
-    
-    return detailed_explanations
+        bottom_line = f"**💡 Bottom Line:** Not enough clear signals right now. Better to wait for a clearer setup."
+
+    return prefix + body + ["", "---", "", bottom_line]
@@ -5,12 +5,30 @@ Aggregates all ICT strategies to provide trading signals
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from ict_strategies import get_all_ict_indicators, calculate_ote_levels
+from ict_strategies import (
+    get_all_ict_indicators, calculate_ote_levels, calculate_ote_levels_arr
+)
+from ict_advanced import (
+    is_in_kill_zone, detect_choch, calculate_premium_discount_zone,
+    get_power_of_3_phase, get_htf_bias,
+    kill_zones_for_index, power_of_3_for_index, POWER_OF_3_PHASES
+)
+from _score_njit import score_bars, HTF_BULLISH, HTF_BEARISH, HTF_NEUTRAL
 
-def filter_recent_zones(zones, current_idx, lookback=50):
-    """Filter zones that are still relevant (recent)"""
+def filter_recent_zones(zones, current_idx, lookback=50, idx_arr=None):
+    """
+    Filter zones that are still relevant (recent)
+
+    When idx_arr (the zones' bar positions, attached by
+    get_all_ict_indicators under '_idx_arrays') is provided, the recency
+    test runs as one vectorized comparison instead of a Python check per
+    zone. (Order blocks interleave bullish/bearish events out of strict
+    index order, so this is a mask rather than a bisect.)
+    """
     if not zones:
         return []
+    if idx_arr is not None:
+        return [zones[i] for i in np.flatnonzero(idx_arr >= current_idx - lookback)]
     return [z for z in zones if current_idx - z.get('idx', z.get('start_idx', 0)) <= lookback]
 
 def check_price_near_zone(current_price, zone_high, zone_low, tolerance=0.02):
@@ -55,17 +73,17 @@ def generate_signal(df, lookback_days=60, htf_df=None):
             'current_price': 0
         }
     
-    # Import advanced ICT functions
-    from ict_advanced import (
-        is_in_kill_zone, detect_choch, calculate_premium_discount_zone,
-        get_power_of_3_phase, get_htf_bias
-    )
-    
     # Get all ICT indicators
     indicators = get_all_ict_indicators(df)
-    
+    idx_arrays = indicators.get('_idx_arrays', {})
+
+    # Raw column arrays once per call; scalar loads after this skip the
+    # pandas indexers
+    high_arr = df['high'].to_numpy()
+    low_arr = df['low'].to_numpy()
+
     current_idx = len(df) - 1
-    current_price = df['close'].iloc[-1]
+    current_price = df['close'].to_numpy()[-1]
     current_timestamp = df.index[-1]
     
     # Initialize scoring
@@ -141,22 +159,26 @@ def generate_signal(df, lookback_days=60, htf_df=None):
     # =================================================================
     # 5. ORDER BLOCKS (Tier 1 - Highest Priority)
     # =================================================================
-    recent_obs = filter_recent_zones(indicators['order_blocks'], current_idx, lookback=lookback_days)
+    recent_obs = filter_recent_zones(indicators['order_blocks'], current_idx,
+                                     lookback=lookback_days,
+                                     idx_arr=idx_arrays.get('order_blocks'))
     bullish_obs = [ob for ob in recent_obs if ob['type'] == 'bullish_ob']
     bearish_obs = [ob for ob in recent_obs if ob['type'] == 'bearish_ob']
     
-    # Calculate OTE levels
-    swing_high = df['high'].iloc[-lookback_days:].max()
-    swing_low = df['low'].iloc[-lookback_days:].min()
+    # Calculate OTE levels - tail reductions on the raw arrays (the
+    # batched path keeps the equivalent per-bar rolling max/min)
+    swing_high = np.nanmax(high_arr[-lookback_days:])
+    swing_low = np.nanmin(low_arr[-lookback_days:])
     ote_levels = calculate_ote_levels(swing_high, swing_low)
+
+    # OTE proximity depends only on the current price and levels, so
+    # resolve it once here rather than per order block
+    ote_vals = np.fromiter(ote_levels.values(), dtype=np.float64)
+    at_ote = bool((np.abs(current_price - ote_vals) / current_price < 0.015).any())
     
     # Check bullish OBs
     for ob in bullish_obs[:2]:  # Top 2 recent OBs
         if check_price_near_zone(current_price, ob['high'], ob['low']):
-            # Check if at OTE level
-            at_ote = any(abs(current_price - level) / current_price < 0.015 
-                        for level in ote_levels.values())
-            
             if at_ote and in_kill_zone:
                 points = 12  # MAXIMUM confluence
                 bullish_points += points
@@ -179,9 +201,6 @@ def generate_signal(df, lookback_days=60, htf_df=None):
     # Check bearish OBs
     for ob in bearish_obs[:2]:
         if check_price_near_zone(current_price, ob['high'], ob['low']):
-            at_ote = any(abs(current_price - level) / current_price < 0.015 
-                        for level in ote_levels.values())
-            
             if at_ote and in_kill_zone:
                 points = 12
                 bearish_points += points
@@ -204,7 +223,9 @@ def generate_signal(df, lookback_days=60, htf_df=None):
     # =================================================================
     # 6. FAIR VALUE GAPS (Tier 2 - Strong in P/D zones)
     # =================================================================
-    recent_fvgs = filter_recent_zones(indicators['fair_value_gaps'], current_idx, lookback=lookback_days)
+    recent_fvgs = filter_recent_zones(indicators['fair_value_gaps'], current_idx,
+                                      lookback=lookback_days,
+                                      idx_arr=idx_arrays.get('fair_value_gaps'))
     bullish_fvgs = [fvg for fvg in recent_fvgs if fvg['type'] == 'bullish_fvg']
     bearish_fvgs = [fvg for fvg in recent_fvgs if fvg['type'] == 'bearish_fvg']
     
@@ -244,7 +265,9 @@ def generate_signal(df, lookback_days=60, htf_df=None):
     # =================================================================
     # 7. LIQUIDITY SWEEPS (Tier 2 - Reversal confirming)
     # =================================================================
-    recent_sweeps = filter_recent_zones(indicators['liquidity_sweeps'], current_idx, lookback=15)
+    recent_sweeps = filter_recent_zones(indicators['liquidity_sweeps'], current_idx,
+                                        lookback=15,
+                                        idx_arr=idx_arrays.get('liquidity_sweeps'))
     for sweep in recent_sweeps[-2:]:
         if sweep['reversal'] == 'bullish':
             points = 6
@@ -260,16 +283,21 @@ def generate_signal(df, lookback_days=60, htf_df=None):
     # =================================================================
     # 8. MARKET STRUCTURE (BOS - Tier 3, lower than CHOCH)
     # =================================================================
-    recent_structure = filter_recent_zones(indicators['market_structure'], current_idx, lookback=30)
-    bullish_bos = [s for s in recent_structure if s.get('direction') == 'bullish']
-    bearish_bos = [s for s in recent_structure if s.get('direction') == 'bearish']
-    
-    if len(bullish_bos) > len(bearish_bos):
+    recent_structure = filter_recent_zones(indicators['market_structure'], current_idx,
+                                           lookback=30,
+                                           idx_arr=idx_arrays.get('market_structure'))
+    # Direction is always 'bullish' or 'bearish', so one pass gives both
+    # counts without building intermediate lists
+    n_bullish_bos = sum(1 for s in recent_structure
+                        if s.get('direction') == 'bullish')
+    n_bearish_bos = len(recent_structure) - n_bullish_bos
+
+    if n_bullish_bos > n_bearish_bos:
         points = 4
         bullish_points += points
         reasoning.append("📈 Bullish market structure (BOS)")
         confluence_details.append(('BOS_BULLISH', points))
-    elif len(bearish_bos) > len(bullish_bos):
+    elif n_bearish_bos > n_bullish_bos:
         points = 4
         bearish_points += points
         reasoning.append("📉 Bearish market structure (BOS)")
@@ -278,7 +306,9 @@ def generate_signal(df, lookback_days=60, htf_df=None):
     # =================================================================
     # 9. DISPLACEMENT (Tier 2 - Institutional move)
     # =================================================================
-    recent_displacements = filter_recent_zones(indicators['displacements'], current_idx, lookback=10)
+    recent_displacements = filter_recent_zones(indicators['displacements'], current_idx,
+                                               lookback=10,
+                                               idx_arr=idx_arrays.get('displacements'))
     for disp in recent_displacements[-1:]:  # Most recent
         if disp['type'] == 'bullish':
             points = 7
@@ -416,6 +446,333 @@ def generate_signal(df, lookback_days=60, htf_df=None):
         'confluence_breakdown': confluence_details  # For debugging
     }
 
+def generate_signals_vectorized(df, lookback_days=60, htf_df=None):
+    """
+    Generate a signal for every bar of df in one batched pass
+
+    Batched counterpart to generate_signal for historical scans. Instead of
+    recomputing every indicator on a growing slice per bar (O(N^2) pandas
+    work), it runs each detector once over the full frame, precomputes the
+    per-bar context (kill zone, premium/discount position, OTE proximity)
+    as arrays, and replays the same confluence scoring per bar against the
+    shared event lists. Events that need confirming bars before they exist
+    (FVGs, sweeps, CHOCH, order-block displacement) are only scored once
+    those bars have printed, so each bar sees the events the per-slice path
+    would; swing points inside the BOS list keep their full-history
+    confirmation, the one place this can differ slightly from a strict
+    bar-by-bar replay.
+
+    Args:
+        df: Full OHLCV dataframe to scan
+        lookback_days: Days to look back for patterns (as generate_signal)
+        htf_df: Higher timeframe dataframe (optional)
+
+    Returns:
+        Tuple (signals, confidences, reasonings): object array of
+        'LONG'/'SHORT'/'NEUTRAL', int array of 0-100 confidence, and a
+        list of per-bar reasoning lists, all aligned with df.index
+    """
+    n = 0 if df is None else len(df)
+    signals = np.full(n, 'NEUTRAL', dtype=object)
+    confidences = np.zeros(n, dtype=np.int64)
+    reasonings = [['Insufficient data'] for _ in range(n)]
+
+    if n < 50:
+        return signals, confidences, reasonings
+
+    indicators = get_all_ict_indicators(df)
+    choch_signals = detect_choch(df, lookback=50)
+
+    close = df['close'].to_numpy(dtype=np.float64)
+
+    # Per-bar context, each computed in a single vectorized pass
+    kz_names, kz_weights = kill_zones_for_index(df.index)
+    p3_phases = power_of_3_for_index(df.index)
+
+    # Rolling range matches df.iloc[-lookback_days:] on each slice
+    range_high = df['high'].rolling(lookback_days, min_periods=1).max().to_numpy()
+    range_low = df['low'].rolling(lookback_days, min_periods=1).min().to_numpy()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        price_position = np.where(range_high != range_low,
+                                  (close - range_low) / (range_high - range_low),
+                                  0.5)
+    detailed_zones = np.select(
+        [price_position > 0.7, price_position > 0.5, price_position < 0.3],
+        ['EXTREME_PREMIUM', 'PREMIUM', 'EXTREME_DISCOUNT'],
+        default='DISCOUNT'
+    )
+    zones = np.where(price_position > 0.5, 'PREMIUM', 'DISCOUNT')
+
+    # OTE proximity against the rolling swing range, all bars at once
+    ote_matrix = calculate_ote_levels_arr(range_high, range_low)
+    at_ote_arr = np.any(
+        np.abs(close[:, None] - ote_matrix) / close[:, None] < 0.015, axis=1)
+
+    # HTF bias does not depend on the scan bar, so compute it once
+    htf_bias_info = {'bias': 'NEUTRAL', 'strength': 0, 'reasoning': 'No HTF data'}
+    if htf_df is not None:
+        htf_bias_info = get_htf_bias(htf_df)
+    htf_bias = htf_bias_info['bias']
+
+    # Event arrays for the compiled kernel (lists stay around so the
+    # reasoning text below can quote the chosen events)
+    obs = indicators['order_blocks']
+    ob_start = np.array([ob['start_idx'] for ob in obs], dtype=np.int64)
+    ob_end = np.array([ob['end_idx'] for ob in obs], dtype=np.int64)
+    ob_high = np.array([ob['high'] for ob in obs], dtype=np.float64)
+    ob_low = np.array([ob['low'] for ob in obs], dtype=np.float64)
+    ob_bull = np.array([ob['type'] == 'bullish_ob' for ob in obs], dtype=bool)
+
+    fvgs = indicators['fair_value_gaps']
+    fvg_start = np.array([f['start_idx'] for f in fvgs], dtype=np.int64)
+    fvg_high = np.array([f['gap_high'] for f in fvgs], dtype=np.float64)
+    fvg_low = np.array([f['gap_low'] for f in fvgs], dtype=np.float64)
+    fvg_bull = np.array([f['type'] == 'bullish_fvg' for f in fvgs], dtype=bool)
+
+    sweeps = indicators['liquidity_sweeps']
+    sweep_idx = np.array([s['idx'] for s in sweeps], dtype=np.int64)
+    sweep_bull = np.array([s['reversal'] == 'bullish' for s in sweeps], dtype=bool)
+
+    structure = indicators['market_structure']
+    bos_idx = np.array([s['idx'] for s in structure], dtype=np.int64)
+    bos_bull = np.array([s.get('direction') == 'bullish' for s in structure],
+                        dtype=bool)
+
+    disps = indicators['displacements']
+    disp_idx = np.array([d['idx'] for d in disps], dtype=np.int64)
+    disp_bull = np.array([d['type'] == 'bullish' for d in disps], dtype=bool)
+
+    choch_idx = np.array([c['idx'] for c in choch_signals], dtype=np.int64)
+    choch_bull = np.array([c['direction'] == 'bullish' for c in choch_signals],
+                          dtype=bool)
+
+    in_kz = kz_names != 'OUTSIDE'
+    zone_premium = price_position > 0.5
+
+    if htf_bias == 'BULLISH':
+        htf_code = HTF_BULLISH
+    elif htf_bias == 'BEARISH':
+        htf_code = HTF_BEARISH
+    else:
+        htf_code = HTF_NEUTRAL
+
+    # One compiled pass over every bar: points, signal, confidence and the
+    # selection state needed to reconstruct the reasoning text
+    (signal_code, confidence_arr, signal_points,
+     choch_lo, choch_hi,
+     sel_bull_ob, bull_ob_tier, sel_bear_ob, bear_ob_tier,
+     sel_bull_fvg, bull_fvg_tier, sel_bear_fvg, bear_fvg_tier,
+     sweep_lo, sweep_hi, bos_flag, sel_disp,
+     prem_pen, disc_pen, htf_case, htf_amt) = score_bars(
+        close, np.asarray(kz_weights, dtype=np.float64), in_kz,
+        zone_premium, at_ote_arr,
+        ob_start, ob_end, ob_high, ob_low, ob_bull,
+        fvg_start, fvg_high, fvg_low, fvg_bull,
+        sweep_idx, sweep_bull, bos_idx, bos_bull, disp_idx, disp_bull,
+        choch_idx, choch_bull,
+        htf_df is not None, htf_code, lookback_days, 49)
+
+    code_to_signal = {1: 'LONG', -1: 'SHORT', 0: 'NEUTRAL'}
+
+    for i in range(49, n):
+        zone_name = kz_names[i]
+        reasoning = []
+
+        # 1. Kill zone
+        if in_kz[i]:
+            reasoning.append(f"⏰ Inside {zone_name.replace('_', ' ')} Kill Zone")
+            if zone_name == 'NEW_YORK_AM':
+                reasoning.append("   → PRIME TIME for ICT setups (7-10 AM EST)")
+        else:
+            reasoning.append(f"⚠️ Outside kill zones (current weight: {kz_weights[i]:.0%})")
+            reasoning.append("   → Lower probability - institutional activity is minimal")
+
+        # 2. Premium/Discount zone
+        reasoning.append(f"📍 Price in {detailed_zones[i]} zone ({price_position[i]:.1%} of range)")
+
+        # 3. Power of 3 phase
+        phase = p3_phases[i]
+        reasoning.append(f"📊 {phase} phase - {POWER_OF_3_PHASES[phase]['description']}")
+
+        # 3.5. HTF bias
+        if htf_df is not None:
+            reasoning.append(f"📈 HTF Bias: {htf_bias} ({htf_bias_info['strength']}%)")
+            reasoning.append(f"   → {htf_bias_info['reasoning']}")
+        else:
+            reasoning.append("📈 HTF Bias: Not available")
+
+        # 4. CHOCH
+        for k in range(max(choch_lo[i], choch_hi[i] - 2), choch_hi[i]):
+            if choch_bull[k]:
+                reasoning.append("🔄 Bullish CHOCH detected (reversal signal)")
+            else:
+                reasoning.append("🔄 Bearish CHOCH detected (reversal signal)")
+
+        # 5. Order blocks
+        k = sel_bull_ob[i]
+        if k >= 0:
+            ob = obs[k]
+            if bull_ob_tier[i] == 3:
+                reasoning.append(f"🟩 Bullish Order Block at OTE in Kill Zone (${ob['low']:.2f}-${ob['high']:.2f})")
+            elif bull_ob_tier[i] == 2:
+                reasoning.append(f"🟩 Bullish Order Block at OTE level")
+            else:
+                reasoning.append(f"🟩 Bullish Order Block (${ob['low']:.2f}-${ob['high']:.2f})")
+
+        k = sel_bear_ob[i]
+        if k >= 0:
+            ob = obs[k]
+            if bear_ob_tier[i] == 3:
+                reasoning.append(f"🟥 Bearish Order Block at OTE in Kill Zone (${ob['low']:.2f}-${ob['high']:.2f})")
+            elif bear_ob_tier[i] == 2:
+                reasoning.append(f"🟥 Bearish Order Block at OTE level")
+            else:
+                reasoning.append(f"🟥 Bearish Order Block (${ob['low']:.2f}-${ob['high']:.2f})")
+
+        # 6. Fair value gaps
+        k = sel_bull_fvg[i]
+        if k >= 0:
+            fvg = fvgs[k]
+            if bull_fvg_tier[i] == 2:
+                reasoning.append(f"⬆️ Bullish FVG in DISCOUNT zone (${fvg['gap_low']:.2f}-${fvg['gap_high']:.2f})")
+            else:
+                reasoning.append(f"⬆️ Bullish FVG (${fvg['gap_low']:.2f}-${fvg['gap_high']:.2f})")
+
+        k = sel_bear_fvg[i]
+        if k >= 0:
+            fvg = fvgs[k]
+            if bear_fvg_tier[i] == 2:
+                reasoning.append(f"⬇️ Bearish FVG in PREMIUM zone (${fvg['gap_low']:.2f}-${fvg['gap_high']:.2f})")
+            else:
+                reasoning.append(f"⬇️ Bearish FVG (${fvg['gap_low']:.2f}-${fvg['gap_high']:.2f})")
+
+        # 7. Liquidity sweeps
+        for k in range(max(sweep_lo[i], sweep_hi[i] - 2), sweep_hi[i]):
+            sweep = sweeps[k]
+            if sweep_bull[k]:
+                reasoning.append(f"💧 Bullish liquidity sweep at ${sweep['price']:.2f}")
+            else:
+                reasoning.append(f"💧 Bearish liquidity sweep at ${sweep['price']:.2f}")
+
+        # 8. Market structure
+        if bos_flag[i] == 1:
+            reasoning.append("📈 Bullish market structure (BOS)")
+        elif bos_flag[i] == -1:
+            reasoning.append("📉 Bearish market structure (BOS)")
+
+        # 9. Displacement
+        k = sel_disp[i]
+        if k >= 0:
+            disp = disps[k]
+            if disp_bull[k]:
+                reasoning.append(f"🚀 Bullish displacement (strength: {disp['strength']:.2f})")
+            else:
+                reasoning.append(f"💥 Bearish displacement (strength: {disp['strength']:.2f})")
+
+        # 10. Penalties & adjustments
+        if prem_pen[i] > 0:
+            reasoning.append(f"⚠️ LONG in PREMIUM zone - reduced confidence by {prem_pen[i]:.1f} points")
+        if disc_pen[i] > 0:
+            reasoning.append(f"⚠️ SHORT in DISCOUNT zone - reduced confidence by {disc_pen[i]:.1f} points")
+
+        if htf_case[i] == 1:
+            reasoning.append(f"✅ HTF ALIGNED with LONG - bonus +{htf_amt[i]:.1f} points")
+        elif htf_case[i] == 2:
+            reasoning.append(f"❌ HTF AGAINST LONG (counter-trend) - penalty -{htf_amt[i]:.1f} points")
+        elif htf_case[i] == 3:
+            reasoning.append(f"✅ HTF ALIGNED with SHORT - bonus +{htf_amt[i]:.1f} points")
+        elif htf_case[i] == 4:
+            reasoning.append(f"❌ HTF AGAINST SHORT (counter-trend) - penalty -{htf_amt[i]:.1f} points")
+
+        # 11. Final signal & confidence
+        signal = code_to_signal[int(signal_code[i])]
+        if signal == 'NEUTRAL':
+            reasoning.append("🤷 Insufficient confluence - no clear signal")
+
+        reasoning.insert(0, f"💯 Total Confluence: {signal_points[i]:.1f} points → {confidence_arr[i]}% confidence")
+
+        signals[i] = signal
+        confidences[i] = confidence_arr[i]
+        reasonings[i] = reasoning
+
+    return signals, confidences, reasonings
+
+def backtest_signal_at_position(df, pos, forward_periods, entry_close,
+                                future_close, signals, confidences, reasonings):
+    """
+    Grade one precomputed signal at an integer position
+
+    Positional fast path for range backtests: the caller computes the
+    per-bar signals once with generate_signals_vectorized plus the entry
+    and shifted close arrays, so each call is a handful of array lookups -
+    no get_indexer lookup and no per-call indicator recomputation.
+
+    Args:
+        df: Full historical dataframe (for the bar timestamp)
+        pos: Integer position of the signal bar
+        forward_periods: Periods (candles) forward to check outcome
+        entry_close: df['close'].to_numpy(), computed once by the caller
+        future_close: df['close'].shift(-forward_periods).to_numpy()
+        signals, confidences, reasonings: generate_signals_vectorized output
+
+    Returns:
+        Dict shaped like backtest_signal's result (minus active_zones,
+        which the batched generator does not track and the range views do
+        not render), or None when there is no forward bar to grade against
+    """
+    if pos + forward_periods >= len(entry_close):
+        return None
+
+    signal_price = entry_close[pos]
+    end_price = future_close[pos]
+    forward_window = entry_close[pos+1:pos+forward_periods+1]
+
+    price_change_pct = ((end_price - signal_price) / signal_price) * 100
+    max_gain_pct = ((forward_window.max() - signal_price) / signal_price) * 100
+    max_loss_pct = ((forward_window.min() - signal_price) / signal_price) * 100
+
+    signal = signals[pos]
+    correct = False
+    if signal == 'LONG':
+        correct = price_change_pct > 0.05
+    elif signal == 'SHORT':
+        correct = price_change_pct < -0.05
+
+    return {
+        'date': df.index[pos],
+        'signal': signal,
+        'confidence': int(confidences[pos]),
+        'reasoning': reasonings[pos],
+        'entry_price': signal_price,
+        'end_price': end_price,
+        'price_change_pct': price_change_pct,
+        'max_gain_pct': max_gain_pct,
+        'max_loss_pct': max_loss_pct,
+        'correct': correct
+    }
+
+def nearest_position(index, target):
+    """
+    Integer position of the index entry closest to target
+
+    Binary search on the (monotonic) DatetimeIndex instead of
+    get_indexer(method='nearest'), which dispatches through a much more
+    general path for a single lookup.
+
+    Args:
+        index: Monotonic increasing DatetimeIndex
+        target: Timestamp to locate (same tz-awareness as the index)
+
+    Returns:
+        Integer position in [0, len(index) - 1]
+    """
+    pos = int(index.searchsorted(target))
+    if pos >= len(index):
+        return len(index) - 1
+    if pos > 0 and target - index[pos - 1] < index[pos] - target:
+        return pos - 1
+    return pos
+
 def backtest_signal(df, target_date, forward_periods=5):
     """
     Generate signal for a historical date and check outcome
@@ -442,7 +799,7 @@ def backtest_signal(df, target_date, forward_periods=5):
         
         # For hourly data, find the closest timestamp on or after the target date
         # For daily data, this will match the exact date
-        target_idx = df.index.get_indexer([target_date], method='nearest')[0]
+        target_idx = nearest_position(df.index, target_date)
         
         # Require minimum data points (adjust based on available data)
         min_required = min(50, len(df) // 3)  # At least 1/3 of data as history, max 50
@@ -450,24 +807,27 @@ def backtest_signal(df, target_date, forward_periods=5):
         if target_idx < min_required or target_idx >= len(df) - forward_periods:
             return None
         
-        # Get data up to target date
-        historical_df = df.iloc[:target_idx+1].copy()
+        # Get data up to target date (view is enough - the signal pipeline
+        # never mutates its input, it extracts numpy arrays)
+        historical_df = df.iloc[:target_idx+1]
         
         # Generate signal
         signal_result = generate_signal(historical_df)
         
-        # Get future prices to check outcome
-        future_prices = df['close'].iloc[target_idx+1:target_idx+forward_periods+1]
-        
+        # Get future prices to check outcome (one raw array instead of
+        # repeated pandas positional indexing)
+        close_arr = df['close'].to_numpy()
+        future_prices = close_arr[target_idx+1:target_idx+forward_periods+1]
+
         if len(future_prices) == 0:
             return None
-            
-        signal_price = df['close'].iloc[target_idx]
-        
+
+        signal_price = close_arr[target_idx]
+
         # Calculate outcome
         max_future_price = future_prices.max()
         min_future_price = future_prices.min()
-        end_price = future_prices.iloc[-1]
+        end_price = future_prices[-1]
         
         price_change_pct = ((end_price - signal_price) / signal_price) * 100
         max_gain_pct = ((max_future_price - signal_price) / signal_price) * 100
@@ -493,7 +853,8 @@ def backtest_signal(df, target_date, forward_periods=5):
             'max_gain_pct': max_gain_pct,
             'max_loss_pct': max_loss_pct,
             'correct': correct,
-            'active_zones': signal_result['active_zones']
+            'active_zones': signal_result['active_zones'],
+            'signal_info': signal_result  # full result, for chart overlays
         }
     except Exception as e:
         print(f"Error in backtest: {e}")